@@ -87,10 +87,10 @@ def master_equity(v_mode, row=None):
 
 
 def master_fixed(v_mode, row=None):
-    """ Master script for Fixed Income Management, include: BACKUP, RESTORE, ADD.
+    """ Master script for Fixed Income Management, include: BACKUP, RESTORE, UPGRADE, ADD.
 
     Args:
-        v_mode (str): BACKUP/RESTORE/ADD
+        v_mode (str): BACKUP/RESTORE/UPGRADE/ADD
         row (list): new transaction entry, default to None [
             :str: Product NAME,
             :str: SYMBOL,
@@ -119,6 +119,8 @@ def master_fixed(v_mode, row=None):
             this_instance.backup()
         elif v_mode.upper() == 'RESTORE':
             this_instance.restore()
+        elif v_mode.upper() == 'UPGRADE':
+            this_instance.upgrade()
         elif v_mode.upper() == 'ADD':
             if isinstance(row, list) and len(row) == 10:
                 if row[9].split('=')[0].upper() == 'YTM':
@@ -140,8 +142,8 @@ def master_fixed(v_mode, row=None):
                                                                                                str(len(row)),
                                                                                                ','.join(row)))
         else:
-            raise IOError('Error: input :v_mode: is not valid ! -> expect backup/restore/add, got {}: {}'.format(
-                str(type(v_mode)), str(v_mode)))
+            raise IOError('Error: input :v_mode: is not valid ! -> expect backup/restore/upgrade/add, got {}: {}'.
+                          format(str(type(v_mode)), str(v_mode)))
         return True
     except Exception as e:
         raise RuntimeError('Error: Failed to run master_fixed() -> '+str(e))
@@ -158,41 +160,48 @@ def master_overview():
     print('[..] Calling master_overview() ...')
     try:
         out_filename = 'snapshots/snapshot_' + datetime.now().strftime('%Y%m%d') + '.html'
-        this_instance = SummaryTool()
+        # read every source once, all reports below are then served from the instance cache
+        this_instance = SummaryTool().cache_result()
         # call function to generate master investment allocation report
-        this_allocation_report_type = this_instance.generate_allocation_report_type()
+        this_allocation_report_type = this_instance.format_for_display(
+            this_instance.generate_allocation_report_type())
         this_allocation_report_type.iloc[-1] = this_allocation_report_type.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         # call function to generate account allocation report
-        this_allocation_report_account = this_instance.generate_allocation_report_account()
+        this_allocation_report_account = this_instance.format_for_display(
+            this_instance.generate_allocation_report_account())
         '''
         # call function to generate equity ETF allocation report
-        this_allocation_report_equity_etf = this_instance.generate_allocation_report_equity_etf()
+        this_allocation_report_equity_etf = this_instance.format_for_display(
+            this_instance.generate_allocation_report_equity_etf())
         this_allocation_report_equity_etf.iloc[-1] = this_allocation_report_equity_etf.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         '''
         # call function to generate ETF allocation report in :broker: Vanguard
-        this_allocation_report_etf_at_vanguard = this_instance.generate_allocation_report_etf_w_account(
-            'Vanguard')
+        this_allocation_report_etf_at_vanguard = this_instance.format_for_display(
+            this_instance.generate_allocation_report_etf_w_account('Vanguard'))
         this_allocation_report_etf_at_vanguard.iloc[-1] = this_allocation_report_etf_at_vanguard.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         # call function to generate ETF allocation report in :broker: Charles Schwab
-        this_allocation_report_etf_at_schwab = this_instance.generate_allocation_report_etf_w_account(
-            'Schwab')
+        this_allocation_report_etf_at_schwab = this_instance.format_for_display(
+            this_instance.generate_allocation_report_etf_w_account('Schwab'))
         this_allocation_report_etf_at_schwab.iloc[-1] = this_allocation_report_etf_at_schwab.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         '''
         # call function to generate Fixed Income ETF allocation report
-        this_allocation_report_fixed_etf = this_instance.generate_allocation_report_fixed_etf()
+        this_allocation_report_fixed_etf = this_instance.format_for_display(
+            this_instance.generate_allocation_report_fixed_etf())
         this_allocation_report_fixed_etf.iloc[-1] = this_allocation_report_fixed_etf.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         '''
         # call function to generate individual Stock holding list
-        this_allocation_report_equity_stock = this_instance.generate_allocation_report_equity_stock()
+        this_allocation_report_equity_stock = this_instance.format_for_display(
+            this_instance.generate_allocation_report_equity_stock())
         this_allocation_report_equity_stock.iloc[-1] = this_allocation_report_equity_stock.iloc[-1].apply(
             lambda x: '//strong/' + str(x) + '/strong//')
         # call function to generate Fixed Income mature calender
-        this_mature_calender = this_instance.generate_mature_calender()
+        this_mature_calender = this_instance.format_for_display(
+            this_instance.generate_mature_calender())
         with open(out_filename, 'w+') as wf:
             tmp_html_data = '<h1>Investment Portfolio Overview - ' + datetime.now().strftime('%b %d, %Y') + '</h1>' + \
                             '\n<h3>Allocation Report - Investment Type </h3>' + \
@@ -220,7 +229,7 @@ def master_overview():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('type', type=str, help='Execution Type: equity/fixed/overview')
-    parser.add_argument('-m', '--mode', type=str, help='Execution Mode: update/backup/restore/add')
+    parser.add_argument('-m', '--mode', type=str, help='Execution Mode: update/backup/restore/upgrade/add')
     parser.add_argument('-ee', '--eq_entry', type=str,
                         help='Transaction Entry to add, len=19):\n e.g. "SYMBOL,ACTION(BUY/SELL),'
                              'TRANSACTION_DATE(YYYY-MM-DD),PRICE,UNITS,INVESTMENT_TYPE(stock/ETF),'
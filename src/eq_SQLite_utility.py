@@ -25,6 +25,10 @@ Examples:
     table_data_transactions = test_instance.get_table_transactions()
     table_data_watch_list = test_instance.get_table_watch_list()
     view_data_positions = test_instance.get_view_positions()
+    dollars_by_account = test_instance.get_account_allocation_joined()
+    with test_instance:
+        table_data_transactions = test_instance.get_table_transactions()
+        view_data_positions = test_instance.get_view_positions()
 
 """
 
@@ -37,6 +41,12 @@ from datetime import datetime
 from .logger import UseLogging
 
 
+# Applied to every new connection: 16MB page cache, in-memory temp tables and 256MB memory-mapped reads
+_CONNECTION_PRAGMAS = ('PRAGMA cache_size = -16000',
+                       'PRAGMA temp_store = MEMORY',
+                       'PRAGMA mmap_size = 268435456')
+
+
 class SQLiteRequest(object):
     """
     The :class: SQLiteRequest can be used for SQLite communications.
@@ -52,9 +62,28 @@ class SQLiteRequest(object):
         self.db_file = v_db_filename
         self.table_schema_file = "templates/equity_tables_schema.json"
         self.view_query_positions = "templates/equity_positions_view_query.sql"
+        self._shared_conn = None
+        self._shared_depth = 0
         _logger_ref = UseLogging(__name__)
         self.logger = _logger_ref.use_loggers('portfolio_management')
 
+    def __enter__(self):
+        """
+        Share one connection and read transaction across all get_* calls made inside a :keyword: with block.
+            The connection is only opened by the first query, blocks can be nested.
+        """
+        self._shared_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._shared_depth -= 1
+        if self._shared_depth == 0 and self._shared_conn is not None:
+            self._shared_conn.commit()
+            self._shared_conn.close()
+            self._shared_conn = None
+            self.logger.info("Connection closed !")
+        return False
+
     def _read_json_schema_file(self, v_table_name):
         """
         The :function: _read_json_schema_file is used to read Table Schema from JSON source file.
@@ -100,6 +129,8 @@ class SQLiteRequest(object):
         """
         try:
             this_conn = sqlite3.connect(self.db_file)
+            for pragma_sql in _CONNECTION_PRAGMAS:
+                this_conn.execute(pragma_sql)
             self.logger.info("Connection to {} has been created ...".format(self.db_file))
             self.logger.info("SQLite version is: " + sqlite3.version)
         except sqlite3.Error as e:
@@ -107,6 +138,36 @@ class SQLiteRequest(object):
             raise e
         return this_conn
 
+    def _fetch_all(self, v_query_sql, v_as_frame=False, v_params=()):
+        """
+        The :function: _fetch_all is used to run a SELECT statement and fetch all rows, on the shared connection
+            inside a :keyword: with block, on a short-lived connection otherwise.
+
+        Args:
+            v_query_sql (str): The SELECT statement to run.
+            v_as_frame (bool): build a Pandas DataFrame with pd.read_sql_query instead, default to False.
+            v_params (tuple): values bound to the ? placeholders of the SELECT statement, default to none.
+
+        Returns:
+            :list: of tuple, or :object: Pandas DataFrame if v_as_frame is True.
+
+        """
+        def _run(v_conn):
+            if v_as_frame:
+                return pd.read_sql_query(v_query_sql, v_conn, params=v_params)
+            return v_conn.execute(v_query_sql, v_params).fetchall()
+
+        if self._shared_depth > 0:
+            if self._shared_conn is None:
+                self._shared_conn = self._create_connection()
+                self._shared_conn.execute('BEGIN')
+            return _run(self._shared_conn)
+        this_conn = self._create_connection()
+        try:
+            return _run(this_conn)
+        finally:
+            this_conn.close()
+
     def create_database(self):
         """
         The :function: create_database is used to create the database file declared in __init__.
@@ -776,15 +837,16 @@ class SQLiteRequest(object):
             self.logger.error("Failed to sync :table: tmp_holdings ! -> " + str(e))
             raise e
 
-    def get_table_transactions(self):
+    def get_table_transactions(self, v_as_frame=False):
         """
         The :function: get_table_transaction is used to query all data from :table: 'transaction' into a list of
             dictionary, use column name as dictionary key.
 
         Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
 
         Returns:
-            :list: of dictionary, can be read by column name.
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
 
         """
         list_of_header = ['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE', 'DESCRIPTION',
@@ -792,11 +854,9 @@ class SQLiteRequest(object):
         try:
             self.logger.info("Attempt to get :table: 'transactions' data ...")
             query_sql = "SELECT {} FROM transactions;".format(', '.join(list_of_header))
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(query_sql)
-            this_result = this_cursor.fetchall()
-            this_conn.close()
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True)
+            this_result = self._fetch_all(query_sql)
             that_output = []
             for row in this_result:
                 this_dict = {}
@@ -825,11 +885,7 @@ class SQLiteRequest(object):
         try:
             self.logger.info("Attempt to get :table: 'watch_list' data ...")
             query_sql = "SELECT {} FROM watch_list;".format(', '.join(list_of_header))
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(query_sql)
-            this_result = this_cursor.fetchall()
-            this_conn.close()
+            this_result = self._fetch_all(query_sql)
             that_output = []
             for row in this_result:
                 this_dict = {}
@@ -841,15 +897,16 @@ class SQLiteRequest(object):
             self.logger.error("Failed to get :table: 'watch_list' data ! -> " + str(e))
             raise e
 
-    def get_view_positions(self):
+    def get_view_positions(self, v_as_frame=False):
         """
         The :function: get_view_positions is used to query all data from :view: 'positions' into a list of
             dictionary, use column name as dictionary key.
 
         Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
 
         Returns:
-            :list: of dictionary, can be read by column name.
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
 
         """
         list_of_header = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS', 'UNITS',
@@ -857,12 +914,9 @@ class SQLiteRequest(object):
         try:
             self.logger.info("Attempt to get :view: 'positions' data ...")
             query_sql = "SELECT {} FROM positions;".format(', '.join(list_of_header))
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(query_sql)
-            this_result = this_cursor.fetchall()
-            this_conn.commit()
-            this_conn.close()
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True)
+            this_result = self._fetch_all(query_sql)
             that_output = []
             for row in this_result:
                 this_dict = {}
@@ -873,3 +927,41 @@ class SQLiteRequest(object):
         except Exception as e:
             self.logger.error("Failed to get :view: 'positions' data ! -> " + str(e))
             raise e
+
+    def get_account_allocation_joined(self, v_as_frame=False):
+        """
+        The :function: get_account_allocation_joined is used to query market value held for each ACCOUNT by joining
+            net UNITS from :table: 'transactions' with DOLLARS from :view: 'positions', aggregated in SQLite, into a
+            list of dictionary. SELL transactions are counted as negative units and closed positions are skipped.
+            Accounts holding only un-priced SYMBOLS report 0.0 TOTAL_DOLLARS.
+
+        Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
+
+        Returns:
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
+
+        """
+        list_of_header = ['ACCOUNT', 'TOTAL_DOLLARS']
+        try:
+            self.logger.info("Attempt to get dollars by account from :table: 'transactions' and :view: 'positions' ...")
+            query_sql = "WITH account_units AS (" \
+                        "SELECT ACCOUNT, SYMBOL, " \
+                        "SUM(CASE WHEN TYPE = 'SELL' THEN -UNITS ELSE UNITS END) AS TOTAL_UNITS " \
+                        "FROM transactions GROUP BY ACCOUNT, SYMBOL HAVING TOTAL_UNITS > 0) " \
+                        "SELECT a.ACCOUNT, TOTAL(a.TOTAL_UNITS * p.DOLLARS) AS TOTAL_DOLLARS " \
+                        "FROM account_units a JOIN positions p ON a.SYMBOL = p.SYMBOL GROUP BY a.ACCOUNT;"
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True)
+            this_result = self._fetch_all(query_sql)
+            that_output = []
+            for row in this_result:
+                this_dict = {}
+                for i in range(len(list_of_header)):
+                    this_dict[list_of_header[i]] = row[i]
+                that_output.append(this_dict)
+            return that_output
+        except Exception as e:
+            self.logger.error("Failed to get dollars by account from :table: 'transactions' and "
+                              ":view: 'positions' ! -> " + str(e))
+            raise e
@@ -9,7 +9,11 @@ This module contains class for Yahoo Finance API requests.
 Note:
     This module depend on following third party library:
      - yfinance v0.1.55+
+     - requests
      - pandas v0.25.0
+     - aiohttp (optional, only required by :function: fetch_portfolio)
+     - diskcache (optional, info dictionaries are cached on disk for 5 minutes when installed and the
+       PORTFOLIO_MGMT_DISK_CACHE environment variable is set to the cache directory)
 
 Examples:
     test_df = Stock('AAPL')
@@ -19,332 +23,606 @@ Examples:
     v_mkt_cap = test_df.get_market_cap()
     ...
 
+    test_batch = Stocks(['AAPL', 'MSFT', 'AMZN'])
+    dict_prev_close = test_batch.get_field('get_previous_close')
+    ...
+
+    dict_quotes = QuoteBatch.fetch(['AAPL', 'MSFT', 'AMZN'])
+    v_mkt_cap = Stock('AAPL').get_market_cap()  # served from the quote batch, no extra request
+    df_quotes = to_frame(['AAPL', 'MSFT', 'AMZN'], ['PREV_CLOSE', 'MKT_CAP'])
+
+    dict_prev_close = asyncio.run(fetch_portfolio(['AAPL', 'MSFT', 'AMZN']))
+
 """
 
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import pandas as pd
 import yfinance as yf
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 from .overview_generator import this_fixed_income_funds, this_equity_funds
 
 
-class Stock(object):
+# HTTP session shared by all yfinance.Ticker objects, so connections to Yahoo Finance are pooled and reused
+_SHARED_SESSION = requests.Session()
+_SHARED_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# Yahoo Finance quote endpoint, accept a comma delimited list of symbols per request
+_QUOTE_URL = 'https://query2.finance.yahoo.com/v7/finance/quote'
+_QUOTE_BATCH_SIZE = 20
+_COOKIE_URL = 'https://fc.yahoo.com'
+_CRUMB_URL = 'https://query2.finance.yahoo.com/v1/test/getcrumb'
+_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                          'Chrome/91.0.4472.124 Safari/537.36'}
+_CREDENTIALS = {}
+_CREDENTIALS_LOCK = threading.Lock()
+# limits for concurrent requests sent by :function: fetch_portfolio
+_ASYNC_CONNECTION_LIMIT = 100
+_ASYNC_REQUEST_LIMIT = 128
+# disk cache for yfinance info dictionaries, only used when the environment variable names a cache directory,
+# bump the schema tag when the shape of cached values changes
+_DISK_CACHE_ENV = 'PORTFOLIO_MGMT_DISK_CACHE'
+_DISK_CACHE_TTL = 300
+_DISK_CACHE_SCHEMA = 'v1'
+_DISK_CACHE = {}
+_DISK_CACHE_LOCK = threading.Lock()
+# in-process cache for yfinance info dictionaries, shared by all :class: Stock objects of the same ticker
+_INFO_CACHE_MAXSIZE = 4096
+_INFO_CACHE_TTL = 300
+# tickers which returned nothing from Yahoo Finance (misspelled/delisted), skipped until the entry expires
+_BAD_TICKER_TTL = 300
+
+# quote key -> DataFrame column returned by :function: to_frame, column names follow :table: watch_list
+QUOTE_COLUMNS = {
+    'longName': 'FULL_NAME',
+    'regularMarketPreviousClose': 'PREV_CLOSE',
+    'fiftyTwoWeekLow': 'LOW_52WKS',
+    'fiftyTwoWeekHigh': 'HIGH_52WKS',
+    'marketCap': 'MKT_CAP',
+    'trailingPE': 'PE',
+    'forwardPE': 'FORWARD_PE',
+    'trailingAnnualDividendYield': 'DIV',
+    'epsTrailingTwelveMonths': 'EPS',
+    'epsForward': 'FORWARD_EPS'
+}
+# yfinance info key -> quote key, for values named differently by the yfinance info dictionary and quote records
+_QUOTE_KEY_ALIASES = {
+    'previousClose': 'regularMarketPreviousClose',
+    'trailingEps': 'epsTrailingTwelveMonths',
+    'forwardEps': 'epsForward'
+}
+
+# price keys used in valuations, a missing key raises KeyError instead of falling back to a default value
+PRICE_FIELDS = ('previousClose', 'regularMarketPreviousClose')
+# default value for each yfinance info key, used when the key is missing or set to None
+FIELD_DEFAULTS = {
+    'fiftyTwoWeekLow': float('nan'),
+    'fiftyTwoWeekHigh': float('nan'),
+    'marketCap': 0,
+    'trailingPE': float('nan'),
+    'forwardPE': float('nan'),
+    'sector': '',
+    'trailingAnnualDividendYield': float('nan'),
+    'trailingEps': float('nan'),
+    'forwardEps': float('nan'),
+    'shortPercentOfFloat': float('nan'),
+    'shortRatio': float('nan'),
+    'beta': float('nan'),
+    'state': '',
+    'city': '',
+    'longName': '',
+    'totalAssets': 0,
+    'yield': float('nan'),
+    'category': '',
+    'fundFamily': ''
+}
+
+
+class _TTLCache(object):
     """
-    The :class: Stock can be used to get latest Quotes and Finance information from Yahoo Finance.
+    The :class: _TTLCache is a thread-safe dictionary with a maximum size, entries expire after :attr: ttl seconds
+        and the least recently used entry is dropped when the cache is full.
     """
-    def __init__(self, v_ticker):
+    def __init__(self, v_maxsize, v_ttl):
         """
-        constructor for :class: Stock. It will create a yfinance.Ticker object.
+        constructor for :class: _TTLCache.
 
         Args:
-            v_ticker (str): ticker for stock to get.
+            v_maxsize (int): maximum number of entries to keep.
+            v_ttl (int): seconds an entry is kept after it is set.
         """
-        try:
-            self.this_instance = yf.Ticker(v_ticker)
-            self.this_ticker = v_ticker
-        except Exception as e:
-            raise RuntimeError(f"Failed to pull information from Yahoo Finance for ticker {v_ticker} -> "+str(e))
+        self.maxsize = v_maxsize
+        self.ttl = v_ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
 
-    def get_previous_close(self):
+    def get(self, v_key, v_default=None):
         """
-        The :function: get_previous_close is used to get previous close price for a stock.
-        """
-        try:
-            if self.this_ticker not in this_fixed_income_funds.keys() and \
-                    self.this_ticker not in this_equity_funds.keys():
-                that_result = self.this_instance.info['previousClose']
-                return that_result
-            else:
-                that_result = self.this_instance.info['regularMarketPreviousClose']
-                return that_result
-        except Exception as e:
-            raise e
+        The :function: get is used to get the value for a key, a hit is marked as the most recently used entry and
+            an expired entry is dropped.
 
-    def get_low_52wks(self):
-        """
-        The :function: get_low_52wks is used to get 52weeks lowest trading price for a stock.
-        """
-        try:
-            that_result = self.this_instance.info['fiftyTwoWeekLow']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        Args:
+            v_key (str): key to get.
+            v_default (object): value returned when the key is missing or expired, default to None.
+        """
+        with self._lock:
+            that_entry = self._data.get(v_key)
+            if that_entry is None:
+                return v_default
+            if that_entry[0] < time.monotonic():
+                del self._data[v_key]
+                return v_default
+            self._data.move_to_end(v_key)
+            return that_entry[1]
 
-    def get_high_52wks(self):
-        """
-        The :function: get_high_52wks is used to get 52weeks highest trading price for a stock.
+    def set(self, v_key, v_value):
         """
-        try:
-            that_result = self.this_instance.info['fiftyTwoWeekHigh']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        The :function: set is used to set the value for a key, the least recently used entries are dropped when the
+            cache grows over :attr: maxsize.
 
-    def get_market_cap(self):
-        """
-        The :function: get_market_cap is used to get latest Market Capitalization for a stock.
-        """
-        try:
-            that_result = self.this_instance.info['marketCap']
-            if that_result is None:
-                that_result = 0
-            return that_result
-        except KeyError:
-            that_result = 0
-            return that_result
-        except Exception as e:
-            raise e
+        Args:
+            v_key (str): key to set.
+            v_value (object): value to keep for :attr: ttl seconds.
+        """
+        with self._lock:
+            self._data.pop(v_key, None)
+            self._data[v_key] = (time.monotonic() + self.ttl, v_value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
 
-    def get_pe(self):
+    def clear(self):
         """
-        The :function: get_pe is used to get trailing P/E ratio for a stock.
+        The :function: clear is used to drop all entries.
         """
-        try:
-            that_result = self.this_instance.info['trailingPE']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        with self._lock:
+            self._data.clear()
 
-    def get_forward_pe(self):
-        """
-        The :function: get_forward_pe is used to get forward P/E ratio for a stock.
-        """
-        try:
-            that_result = self.this_instance.info['forwardPE']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
 
-    def get_sector(self):
-        """
-        The :function: get_sector is used to get business sector for a stock.
-        """
-        try:
-            that_result = self.this_instance.info['sector']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
-        except Exception as e:
-            raise e
+_INFO_CACHE = _TTLCache(_INFO_CACHE_MAXSIZE, _INFO_CACHE_TTL)
+_BAD_TICKERS = _TTLCache(_INFO_CACHE_MAXSIZE, _BAD_TICKER_TTL)
+# quote records pulled by QuoteBatch.fetch(), keyed by ticker, getters of :class: Stock read from here first
+_QUOTE_RESULTS = _TTLCache(_INFO_CACHE_MAXSIZE, _INFO_CACHE_TTL)
 
-    def get_dividend(self):
-        """
-        The :function: get_dividend is used to get dividend yield for a stock.
-        """
-        try:
-            that_result = self.this_instance.info['trailingAnnualDividendYield']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
 
-    def get_eps(self):
-        """
-        The :function: get_eps is used to get trailing Earning Per Share for a stock.
+def _get_disk_cache():
+    """
+    The :function: _get_disk_cache is used to open the disk cache on first call, in the directory named by the
+        PORTFOLIO_MGMT_DISK_CACHE environment variable. Opening is guarded by a lock, so threads prefetching in
+        :class: Stocks share a single diskcache.Cache handle.
+
+    Returns:
+        diskcache.Cache object, None if diskcache is not installed or the environment variable is not set.
+
+    """
+    that_directory = os.environ.get(_DISK_CACHE_ENV)
+    if diskcache is None or not that_directory:
+        return None
+    if 'instance' not in _DISK_CACHE:
+        with _DISK_CACHE_LOCK:
+            if 'instance' not in _DISK_CACHE:
+                _DISK_CACHE['instance'] = diskcache.Cache(that_directory)
+    return _DISK_CACHE['instance']
+
+
+# (getter name, yfinance info key, description) for getters generated on :class: Stock
+_STOCK_FIELDS = [
+    ('get_low_52wks', 'fiftyTwoWeekLow', '52weeks lowest trading price for a stock'),
+    ('get_high_52wks', 'fiftyTwoWeekHigh', '52weeks highest trading price for a stock'),
+    ('get_market_cap', 'marketCap', 'latest Market Capitalization for a stock'),
+    ('get_pe', 'trailingPE', 'trailing P/E ratio for a stock'),
+    ('get_forward_pe', 'forwardPE', 'forward P/E ratio for a stock'),
+    ('get_sector', 'sector', 'business sector for a stock'),
+    ('get_dividend', 'trailingAnnualDividendYield', 'dividend yield for a stock'),
+    ('get_eps', 'trailingEps', 'trailing Earning Per Share for a stock'),
+    ('get_forward_eps', 'forwardEps', 'forward Earning Per Share for a stock'),
+    ('get_short_float', 'shortPercentOfFloat', 'short percentage of float for a stock'),
+    ('get_short_ratio', 'shortRatio', 'short percentage of average daily trade for a stock'),
+    ('get_beta', 'beta', 'beta ratio for a stock'),
+    ('get_headquarter_country', 'state', 'company location (country) for a stock'),
+    ('get_headquarter_city', 'city', 'company location (city) for a stock'),
+    ('get_name', 'longName', 'long/short name for a stock')
+]
+# (getter name, yfinance info key, description) for getters generated on :class: ETF
+_ETF_FIELDS = [
+    ('get_total_assets', 'totalAssets', 'Total Assets for an ETF'),
+    ('get_yield', 'yield', 'Yield for an ETF'),
+    ('get_category', 'category', 'Category for an ETF'),
+    ('get_fund_family', 'fundFamily', 'Fund Family for an ETF')
+]
+
+
+def _make_getter(v_name, v_key, v_description):
+    """
+    The :function: _make_getter is used to build a getter which returns the value for a yfinance info key.
+
+    Args:
+        v_name (str): name of the getter.
+        v_key (str): yfinance info key to get.
+        v_description (str): description used in the docstring of the getter.
+    """
+    def getter(self):
+        return self._field(v_key)
+    getter.__name__ = v_name
+    getter.__doc__ = f"""
+        The :function: {v_name} is used to get {v_description}.
         """
-        try:
-            that_result = self.this_instance.info['trailingEps']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+    return getter
+
 
-    def get_forward_eps(self):
+def _add_getters(v_fields):
+    """
+    The :function: _add_getters is a class decorator used to add one getter for each entry in :param: v_fields.
+    """
+    def decorator(cls):
+        for that_name, that_key, that_description in v_fields:
+            that_getter = _make_getter(that_name, that_key, that_description)
+            that_getter.__qualname__ = f'{cls.__name__}.{that_name}'
+            setattr(cls, that_name, that_getter)
+        return cls
+    return decorator
+
+
+@_add_getters(_STOCK_FIELDS)
+class Stock(object):
+    """
+    The :class: Stock can be used to get latest Quotes and Finance information from Yahoo Finance.
+    """
+    __slots__ = ('this_instance', 'this_ticker', '_info', '_prev_close_key')
+
+    def __init__(self, v_ticker, v_prefetch=False):
         """
-        The :function: get_forward_eps is used to get forward Earning Per Share for a stock.
+        constructor for :class: Stock. It will create a yfinance.Ticker object on the shared HTTP session.
+
+        Args:
+            v_ticker (str): ticker for stock to get.
+            v_prefetch (bool): pull the info dictionary in the constructor instead of the first getter call,
+                default to False.
         """
         try:
-            that_result = self.this_instance.info['forwardEps']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
+            self.this_instance = yf.Ticker(v_ticker, session=_SHARED_SESSION)
+            self.this_ticker = v_ticker
+            # skip the network for a ticker already known as bad
+            self._info = {} if _BAD_TICKERS.get(v_ticker) else None
+            # funds only report the regular market previous close
+            if v_ticker in this_fixed_income_funds or v_ticker in this_equity_funds:
+                self._prev_close_key = 'regularMarketPreviousClose'
+            else:
+                self._prev_close_key = 'previousClose'
+            if v_prefetch:
+                self._get_info()
         except Exception as e:
-            raise e
+            raise RuntimeError(f"Failed to pull information from Yahoo Finance for ticker {v_ticker} -> "+str(e))
+
+    def _get_info(self):
+        """
+        The :function: _get_info is used to get the yfinance info dictionary for a stock. The info dictionary is
+            shared by all instances of the same ticker through the in-process cache, otherwise it is pulled from the
+            disk cache or Yahoo Finance on first call, then reused by every getter of this instance.
+        """
+        if self._info is None:
+            that_info = _INFO_CACHE.get(self.this_ticker)
+            if that_info is None:
+                that_cache = _get_disk_cache()
+                that_key = ('info', _DISK_CACHE_SCHEMA, self.this_ticker)
+                that_info = that_cache.get(that_key) if that_cache is not None else None
+                if that_info is None:
+                    that_info = self._pull_info()
+                    if that_info and that_cache is not None:
+                        that_cache.set(that_key, that_info, expire=_DISK_CACHE_TTL)
+                if that_info:
+                    _INFO_CACHE.set(self.this_ticker, that_info)
+            self._info = that_info
+        return self._info
 
-    def get_short_float(self):
+    def _pull_info(self):
         """
-        The :function: get_short_float is used to get short percentage of float for a stock.
+        The :function: _pull_info is used to pull the yfinance info dictionary from Yahoo Finance. Ticker is marked
+            as bad when Yahoo Finance returns an empty dictionary or HTTP 404, so it is skipped for a while.
         """
         try:
-            that_result = self.this_instance.info['shortPercentOfFloat']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+            that_info = self.this_instance.info or {}
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            that_info = {}
+        if not that_info:
+            _BAD_TICKERS.set(self.this_ticker, True)
+        return that_info
 
-    def get_short_ratio(self):
-        """
-        The :function: get_short_ratio is used to get short percentage of average daily trade for a stock.
+    def _field(self, v_key):
         """
-        try:
-            that_result = self.this_instance.info['shortRatio']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        The :function: _field is used to get the value for a yfinance info key. The quote record pulled by
+            QuoteBatch.fetch() is used first (info keys are translated by _QUOTE_KEY_ALIASES), then the yfinance
+            info dictionary, and the default value in FIELD_DEFAULTS when the key is missing or set to None. Keys in
+            PRICE_FIELDS have no default value, KeyError is raised when the key is missing.
 
-    def get_beta(self):
+        Args:
+            v_key (str): yfinance info key to get.
+        """
+        that_result = _QUOTE_RESULTS.get(self.this_ticker.upper(), {}).get(_QUOTE_KEY_ALIASES.get(v_key, v_key))
+        if that_result is None:
+            if v_key in PRICE_FIELDS:
+                return self._get_info()[v_key]
+            that_result = self._get_info().get(v_key)
+        return FIELD_DEFAULTS[v_key] if that_result is None else that_result
+
+    def get_previous_close(self):
         """
-        The :function: get_beta is used to get beta ratio for a stock.
+        The :function: get_previous_close is used to get previous close price for a stock.
         """
-        try:
-            that_result = self.this_instance.info['beta']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        return self._field(self._prev_close_key)
 
-    def get_headquarter_country(self):
-        """
-        The :function: get_headquarter_country is used to get company location (country) for a stock.
+
+@_add_getters(_ETF_FIELDS)
+class ETF(Stock):
+    """
+    The :class: ETF is a child of :class: Stock, it can be used to get latest Quotes and Financial information for a
+        Exchange Traded Fund from Yahoo Finance.
+    """
+    __slots__ = ()
+
+
+class Stocks(object):
+    """
+    The :class: Stocks can be used to get latest Quotes and Finance information for a list of stocks from Yahoo
+        Finance, tickers are pulled concurrently.
+    """
+    this_class = Stock
+
+    def __init__(self, v_tickers, v_threads=16):
         """
-        try:
-            that_result = self.this_instance.info['state']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
-        except Exception as e:
-            raise e
+        constructor for :class: Stocks. It will create a :class: Stock object for each ticker, then pull the info
+            dictionary for all tickers in parallel.
 
-    def get_headquarter_city(self):
+        Args:
+            v_tickers (list): tickers for stocks to get.
+            v_threads (int): maximum number of threads to use, default to 16.
+        """
+        self.this_tickers = list(v_tickers)
+        self.this_threads = v_threads
+        with ThreadPoolExecutor(max_workers=v_threads) as executor:
+            # prefetch the info dictionary in the constructor, so the network waits overlap across threads
+            self.this_instances = dict(zip(self.this_tickers, executor.map(
+                lambda x: self.this_class(x, v_prefetch=True), self.this_tickers)))
+
+    def get_field(self, v_field_name):
         """
-        The :function: get_headquarter_state is used to get company location (city) for a stock.
+        The :function: get_field is used to call the same getter on every ticker.
+
+        Args:
+            v_field_name (str): name of the getter, e.g. 'get_previous_close'.
+
+        Returns:
+            :dict: of ticker -> value returned by the getter.
+
         """
-        try:
-            that_result = self.this_instance.info['city']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
-        except Exception as e:
-            raise e
+        with ThreadPoolExecutor(max_workers=self.this_threads) as executor:
+            that_futures = {k: executor.submit(getattr(v, v_field_name)) for k, v in self.this_instances.items()}
+            return {k: v.result() for k, v in that_futures.items()}
+
+
+class ETFs(Stocks):
+    """
+    The :class: ETFs is a child of :class: Stocks, it can be used to get latest Quotes and Financial information for a
+        list of Exchange Traded Funds from Yahoo Finance.
+    """
+    this_class = ETF
+
+
+def _get_credentials():
+    """
+    The :function: _get_credentials is used to get the cookie and crumb required by the Yahoo Finance quote endpoint.
+        The cookie is kept by the shared HTTP session, the crumb is pulled once and reused until it is rejected.
+        Pulling is guarded by a lock, so callers renewing a rejected crumb at the same time share one new crumb.
+
+    Returns:
+        :str: crumb.
+
+    """
+    with _CREDENTIALS_LOCK:
+        if 'crumb' not in _CREDENTIALS:
+            _SHARED_SESSION.get(_COOKIE_URL, headers=_HEADERS, allow_redirects=True)
+            that_response = _SHARED_SESSION.get(_CRUMB_URL, headers=_HEADERS)
+            that_response.raise_for_status()
+            _CREDENTIALS['crumb'] = that_response.text
+        return _CREDENTIALS['crumb']
+
+
+def _clear_credentials(v_crumb):
+    """
+    The :function: _clear_credentials is used to drop a crumb rejected by the Yahoo Finance quote endpoint. The crumb
+        is only dropped when it is still the stored one, so a crumb already renewed by another caller is kept.
+
+    Args:
+        v_crumb (str): crumb rejected with HTTP 401.
+    """
+    with _CREDENTIALS_LOCK:
+        if _CREDENTIALS.get('crumb') == v_crumb:
+            _CREDENTIALS.clear()
+
+
+def _get_quotes(v_symbols):
+    """
+    The :function: _get_quotes is used to request quote records from the Yahoo Finance quote endpoint. When the crumb
+        is rejected with HTTP 401, the cookie and crumb are pulled again and the request is sent once more.
+
+    Args:
+        v_symbols (str): comma delimited list of tickers to get.
 
-    def get_name(self):
+    Returns:
+        :list: of quote records.
+
+    """
+    for that_retry in (False, True):
+        that_crumb = _get_credentials()
+        that_response = _SHARED_SESSION.get(_QUOTE_URL, params={'symbols': v_symbols, 'crumb': that_crumb},
+                                            headers=_HEADERS)
+        if that_response.status_code != 401 or that_retry:
+            break
+        _clear_credentials(that_crumb)
+    that_response.raise_for_status()
+    return that_response.json()['quoteResponse']['result']
+
+
+class QuoteBatch(object):
+    """
+    The :class: QuoteBatch can be used to get quote fields (previous close, 52weeks low/high, market cap, P/E, ...)
+        for many tickers from the Yahoo Finance quote endpoint, up to 20 tickers per request.
+    """
+    @staticmethod
+    def fetch(v_tickers):
         """
-        The :function: get_name is used to get long/short name for a stock.
+        The :function: fetch is used to pull quote records for a list of tickers. Records are also kept in the
+            module for 5 minutes, so getters of :class: Stock for these tickers are served without calling yfinance,
+            other fields (sector, city, fundFamily, ...) still fall back to yfinance.
+
+        Args:
+            v_tickers (list): tickers to get.
+
+        Returns:
+            :dict: of ticker -> quote record.
+
         """
+        v_tickers = list(v_tickers)
+        that_results = {}
         try:
-            that_result = self.this_instance.info['longName']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
+            for i in range(0, len(v_tickers), _QUOTE_BATCH_SIZE):
+                for row in _get_quotes(','.join(v_tickers[i:i + _QUOTE_BATCH_SIZE])):
+                    that_results[row['symbol']] = row
         except Exception as e:
-            raise e
+            raise RuntimeError(f"Failed to pull quotes from Yahoo Finance for tickers {','.join(v_tickers)} -> "+str(e))
+        for that_ticker, that_row in that_results.items():
+            _QUOTE_RESULTS.set(that_ticker.upper(), that_row)
+        return that_results
 
 
-class ETF(Stock):
+def to_frame(v_tickers, v_fields=None):
     """
-    The :class: ETF is a child of :class: Stock, it can be used to get latest Quotes and Financial information for a
-        Exchange Traded Fund from Yahoo Finance.
+    The :function: to_frame is used to get quote fields for many tickers as one Pandas dataframe.
+
+    Args:
+        v_tickers (list): tickers to get.
+        v_fields (list): columns to return (see QUOTE_COLUMNS), default to None for all columns.
+
+    Returns:
+        :object: Pandas dataframe, indexed by upper-cased ticker.
+
     """
-    def get_total_assets(self):
-        """
-        The :function: get_total_assets is used to get Total Assets for an ETF.
+    # Yahoo keys the quote records by upper-cased symbol
+    v_tickers = [x.upper() for x in v_tickers]
+    that_results = QuoteBatch.fetch(v_tickers)
+    df = pd.DataFrame.from_dict(that_results, orient='index').reindex(
+        index=v_tickers, columns=list(QUOTE_COLUMNS.keys())).rename(columns=QUOTE_COLUMNS)
+    return df if v_fields is None else df[v_fields]
+
+
+class AsyncStock(object):
+    """
+    The :class: AsyncStock can be used to get latest Quotes from the Yahoo Finance quote endpoint with asyncio, so
+        requests for many tickers can be in flight at the same time.
+    """
+    def __init__(self, v_ticker, v_session, v_semaphore, v_crumb):
         """
-        try:
-            that_result = self.this_instance.info['totalAssets']
-            if that_result is None:
-                that_result = 0
-            return that_result
-        except KeyError:
-            that_result = 0
-            return that_result
-        except Exception as e:
-            raise e
+        constructor for :class: AsyncStock.
+
+        Args:
+            v_ticker (str): ticker for stock to get.
+            v_session (aiohttp.ClientSession): HTTP session shared by all tickers.
+            v_semaphore (asyncio.Semaphore): limit for requests in flight, shared by all tickers.
+            v_crumb (str): crumb returned by :function: _get_credentials.
+        """
+        self.this_ticker = v_ticker
+        self._session = v_session
+        self._semaphore = v_semaphore
+        self._crumb = v_crumb
+        self._info = None
+
+    async def get_info(self):
+        """
+        The :function: get_info is used to get the quote record for a stock, pulled on first call then reused.
+            When the crumb is rejected with HTTP 401, the cookie and crumb are pulled again and the request is sent
+            once more.
+        """
+        if self._info is None:
+            async with self._semaphore:
+                for that_retry in (False, True):
+                    async with self._session.get(_QUOTE_URL, params={'symbols': self.this_ticker,
+                                                                     'crumb': self._crumb}) as that_response:
+                        if that_response.status != 401 or that_retry:
+                            that_response.raise_for_status()
+                            that_json = await that_response.json()
+                            break
+                    await self._renew_crumb()
+            that_results = that_json['quoteResponse']['result']
+            self._info = that_results[0] if that_results else {}
+        return self._info
 
-    def get_yield(self):
+    async def _renew_crumb(self):
         """
-        The :function: get_yield is used to get Yield for an ETF.
+        The :function: _renew_crumb is used to replace a rejected crumb. The crumb is only pulled again when no other
+            stock renewed it already, and the new cookie of the shared HTTP session is copied to the aiohttp session.
         """
-        try:
-            that_result = self.this_instance.info['yield']
-            if that_result is None:
-                that_result = float('nan')
-            return that_result
-        except KeyError:
-            that_result = float('nan')
-            return that_result
-        except Exception as e:
-            raise e
+        that_loop = asyncio.get_running_loop()
+        await that_loop.run_in_executor(None, _clear_credentials, self._crumb)
+        self._crumb = await that_loop.run_in_executor(None, _get_credentials)
+        self._session.cookie_jar.update_cookies(_SHARED_SESSION.cookies.get_dict())
 
-    def get_category(self):
+    async def get_field(self, v_key):
         """
-        The :function: get_category is used to get Category for an ETF.
+        The :function: get_field is used to get the value for a quote key, fall back to the default value in
+            FIELD_DEFAULTS when the key is missing or set to None. Keys in PRICE_FIELDS have no default value,
+            KeyError is raised when the key is missing.
+
+        Args:
+            v_key (str): quote key to get.
         """
-        try:
-            that_result = self.this_instance.info['category']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
-        except Exception as e:
-            raise e
+        if v_key in PRICE_FIELDS:
+            return (await self.get_info())[v_key]
+        that_default = FIELD_DEFAULTS.get(v_key)
+        that_result = (await self.get_info()).get(v_key)
+        return that_default if that_result is None else that_result
 
-    def get_fund_family(self):
+    async def get_previous_close(self):
         """
-        The :function: get_fund_family is used to get Fund Family for an ETF.
+        The :function: get_previous_close is used to get previous close price for a stock.
         """
-        try:
-            that_result = self.this_instance.info['fundFamily']
-            if that_result is None:
-                that_result = ''
-            return that_result
-        except KeyError:
-            that_result = ''
-            return that_result
-        except Exception as e:
-            raise e
+        return await self.get_field('regularMarketPreviousClose')
+
+
+async def fetch_portfolio(v_tickers, v_key='regularMarketPreviousClose'):
+    """
+    The :function: fetch_portfolio is used to get the same quote key for many tickers concurrently.
+
+    Args:
+        v_tickers (list): tickers to get.
+        v_key (str): quote key to get, default to 'regularMarketPreviousClose'.
+
+    Returns:
+        :dict: of ticker -> value.
+
+    """
+    if aiohttp is None:
+        raise RuntimeError("Failed to pull quotes from Yahoo Finance -> :function: fetch_portfolio requires aiohttp")
+    v_tickers = list(v_tickers)
+    # cookie and crumb are pulled with blocking requests calls, keep them off the event loop
+    that_crumb = await asyncio.get_running_loop().run_in_executor(None, _get_credentials)
+    that_semaphore = asyncio.Semaphore(_ASYNC_REQUEST_LIMIT)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=_ASYNC_CONNECTION_LIMIT),
+                                     cookies=_SHARED_SESSION.cookies.get_dict(),
+                                     headers=_HEADERS) as that_session:
+        that_stocks = [AsyncStock(x, that_session, that_semaphore, that_crumb) for x in v_tickers]
+        that_results = await asyncio.gather(*[x.get_field(v_key) for x in that_stocks])
+    return dict(zip(v_tickers, that_results))
@@ -15,6 +15,9 @@ Examples:
     test_instance.create_database()
     test_instance.create_table_transactions_fixed()
     test_instance.create_view_positions_fixed()
+    test_instance.upgrade_table_transactions_fixed()
+    active_transactions = test_instance.get_table_transactions_fixed(v_active_only=True)
+    allocation_by_type = test_instance.get_allocation_by_type_fixed()
 
 """
 
@@ -67,6 +70,7 @@ class FixedSQLiteRequest(SQLiteRequest):
             this_conn = self._create_connection()
             this_cursor = this_conn.cursor()
             this_cursor.execute(create_table_sql)
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_end_date ON transactions (END_DATE);")
             self.logger.info(":table: 'transactions' has been created ...")
             this_conn.close()
             self.logger.info("Connection closed !")
@@ -75,6 +79,29 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to create :table: 'transactions' ! -> " + str(e))
             raise e
 
+    def upgrade_table_transactions_fixed(self):
+        """
+        The :function: upgrade_table_transactions_fixed is used to add the END_DATE index to :table: 'transactions'
+            in a SQLite DB file created before the index was part of create_table_transactions_fixed.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_end_date ON transactions (END_DATE);")
+            self.logger.info(":table: 'transactions' has been upgraded with index on END_DATE ...")
+            this_conn.close()
+            self.logger.info("Connection closed !")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to upgrade :table: 'transactions' ! -> " + str(e))
+            raise e
+
     def create_view_positions_fixed(self):
         """
         The :function: create_view_positions_fixed is used to create :view: 'positions' in the SQLite DB file.
@@ -277,7 +304,7 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to load backup for :table: 'transactions' ! -> " + str(e))
             raise e
 
-    def get_table_transactions_fixed(self):
+    def get_table_transactions_fixed(self, v_as_frame=False, v_active_only=False, v_as_of=None):
         """
         The :function: get_table_transaction_fixed is used to query all data from :table: 'transaction' into a list of
             dictionary, use column name as dictionary key.
@@ -285,21 +312,27 @@ class FixedSQLiteRequest(SQLiteRequest):
         TO-DO
 
         Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
+            v_active_only (bool): skip rows with END_DATE before v_as_of, default to False.
+            v_as_of (str): Date in format 'YYYY-MM-DD' used by v_active_only, default to today.
 
         Returns:
-            :list: of dictionary, can be read by column name.
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
 
         """
         list_of_header = ['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE', 'TOTAL_DOLLARS',
                           'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM', 'ACCOUNT']
         try:
             self.logger.info("Attempt to get :table: 'transactions' data ...")
-            query_sql = "SELECT {} FROM transactions;".format(', '.join(list_of_header))
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(query_sql)
-            this_result = this_cursor.fetchall()
-            this_conn.close()
+            query_sql = "SELECT {} FROM transactions".format(', '.join(list_of_header))
+            query_params = ()
+            if v_active_only:
+                query_sql += " WHERE END_DATE >= ?"
+                query_params = (v_as_of or datetime.now().strftime('%Y-%m-%d'),)
+            query_sql += ";"
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True, v_params=query_params)
+            this_result = self._fetch_all(query_sql, v_params=query_params)
             that_output = []
             for row in this_result:
                 this_dict = {}
@@ -311,7 +344,7 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to get :table: 'transactions' data ! -> " + str(e))
             raise e
 
-    def get_view_positions_fixed(self):
+    def get_view_positions_fixed(self, v_as_frame=False):
         """
         The :function: get_view_positions_fixed is used to query all data from :view: 'positions' into a list of
             dictionary, use column name as dictionary key.
@@ -319,9 +352,10 @@ class FixedSQLiteRequest(SQLiteRequest):
         TO-DO
 
         Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
 
         Returns:
-            :list: of dictionary, can be read by column name.
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
 
         """
         list_of_header = ['NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE', 'TOTAL_DOLLARS', 'ADD_DATE',
@@ -329,12 +363,9 @@ class FixedSQLiteRequest(SQLiteRequest):
         try:
             self.logger.info("Attempt to get :view: 'positions' data ...")
             query_sql = "SELECT {} FROM positions WHERE IS_MATURED = 0;".format(', '.join(list_of_header))
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(query_sql)
-            this_result = this_cursor.fetchall()
-            this_conn.commit()
-            this_conn.close()
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True)
+            this_result = self._fetch_all(query_sql)
             that_output = []
             for row in this_result:
                 this_dict = {}
@@ -345,3 +376,34 @@ class FixedSQLiteRequest(SQLiteRequest):
         except Exception as e:
             self.logger.error("Failed to get :view: 'positions' data ! -> " + str(e))
             raise e
+
+    def get_allocation_by_type_fixed(self, v_as_frame=False):
+        """
+        The :function: get_allocation_by_type_fixed is used to query total dollars for each INVESTMENT_TYPE from
+            :view: 'positions', aggregated in SQLite, into a list of dictionary. Matured entries are skipped.
+
+        Args:
+            v_as_frame (bool): return a Pandas DataFrame built by pd.read_sql_query, default to False.
+
+        Returns:
+            :list: of dictionary, can be read by column name, or :object: Pandas DataFrame if v_as_frame is True.
+
+        """
+        list_of_header = ['INVESTMENT_TYPE', 'TOTAL_DOLLARS']
+        try:
+            self.logger.info("Attempt to get allocation by investment type from :view: 'positions' ...")
+            query_sql = "SELECT INVESTMENT_TYPE, SUM(TOTAL_DOLLARS) AS TOTAL_DOLLARS FROM positions " \
+                        "WHERE IS_MATURED = 0 GROUP BY INVESTMENT_TYPE;"
+            if v_as_frame:
+                return self._fetch_all(query_sql, v_as_frame=True)
+            this_result = self._fetch_all(query_sql)
+            that_output = []
+            for row in this_result:
+                this_dict = {}
+                for i in range(len(list_of_header)):
+                    this_dict[list_of_header[i]] = row[i]
+                that_output.append(this_dict)
+            return that_output
+        except Exception as e:
+            self.logger.error("Failed to get allocation by investment type from :view: 'positions' ! -> " + str(e))
+            raise e
@@ -21,6 +21,11 @@ Examples:
         this_instance = fixed_DbCommands()
         this_instance.restore()
 
+    -- Upgrade an existing SQLite Database 'fixed_income' to the current schema.
+        from src.fixed_income import DbCommands as fixed_DbCommands
+        this_instance = fixed_DbCommands()
+        this_instance.upgrade()
+
     -- Add new transaction into SQLite Database 'fixed_income' Table 'transactions'.
         from src.fixed_income import DbCommands as fixed_DbCommands
         this_instance = fixed_DbCommands()
@@ -100,6 +105,21 @@ class DbCommands(object):
             raise e
         self.logger.info(f'.. Database has been restored from: backup/{backup_file}')
 
+    def upgrade(self):
+        """Call fixed_SQLite_utility to bring an existing fixed income database up to the current schema.
+
+        Return: none.
+
+        """
+        self.logger.info('Upgrading current database...')
+        try:
+            _instance = FixedSQLiteRequest(self.production_db_file)
+            _instance.upgrade_table_transactions_fixed()
+        except Exception as e:
+            self.logger.error('Failed to upgrade current database -> '+str(e))
+            raise e
+        self.logger.info(f'.. Database has been upgraded: {self.production_db_file}')
+
     def add(self, v_name, v_symbol, v_investment_type, v_units, v_face_value, v_add_date, v_end_date, v_total_cost,
             v_account, **kwargs):
         """Call fixed_SQLite_utility to add a new entry into fixed income database.
@@ -30,9 +30,14 @@ Examples:
     -- Generate Mature Calender for Fixed Income:
         this_instance.generate_mature_calender()
 
+    -- Load all source data once, then share it across several reports:
+        this_instance = SummaryTool().cache_result()
+
 """
 
-from datetime import datetime
+import os
+from functools import wraps
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
 
@@ -159,6 +164,90 @@ this_equity_funds = {
             'Foreign Equity', 'Emerging Markets']
 }
 
+# Column dtypes applied to the frames read from SQLite and others.json, low-cardinality text is stored as category
+_EQ_TRANSACTIONS_DTYPES = {'SYMBOL': 'category', 'TYPE': 'category', 'DOLLARS': 'float64', 'UNITS': 'float64',
+                           'INVESTMENT_TYPE': 'category', 'ACCOUNT': 'category', 'TOTAL_DOLLARS': 'float64'}
+_EQ_POSITIONS_DTYPES = {'SYMBOL': 'category', 'INVESTMENT_TYPE': 'category', 'COST_DOLLARS': 'float64',
+                        'DOLLARS': 'float64', 'UNITS': 'float64', 'MKT_VALUE': 'float64',
+                        'GAIN_PER_SHARE': 'float64', 'GAIN_TOTAL': 'float64', 'GAIN_PERCENTAGE': 'float64'}
+_EQ_ACCOUNT_DTYPES = {'ACCOUNT': 'category', 'TOTAL_DOLLARS': 'float64'}
+_FIXED_TRANSACTIONS_DTYPES = {'INVESTMENT_TYPE': 'category', 'UNITS': 'float64', 'FACE_VALUE': 'float64',
+                              'TOTAL_DOLLARS': 'float64', 'TOTAL_COST': 'float64', 'APR': 'float64',
+                              'YTM': 'float64', 'ACCOUNT': 'category'}
+_FIXED_POSITIONS_DTYPES = {'INVESTMENT_TYPE': 'category', 'UNITS': 'float64', 'FACE_VALUE': 'float64',
+                           'TOTAL_DOLLARS': 'float64', 'TOTAL_COST': 'float64', 'RETURN_RATE': 'float64',
+                           'RETURN_DOLLARS': 'float64'}
+_FIXED_ALLOCATION_DTYPES = {'INVESTMENT_TYPE': 'category', 'TOTAL_DOLLARS': 'float64'}
+_OTHER_INVESTMENT_DTYPES = {'MAJOR_TYPE': 'category', 'ACCOUNT': 'category'}
+
+# Read-only symbol -> (description, asset class, subclass) tables, frozen at import
+_FIXED_META = MappingProxyType({k.upper(): tuple(v) for k, v in this_fixed_income_funds.items()})
+_EQ_META = MappingProxyType({k.upper(): tuple(v) for k, v in this_equity_funds.items()})
+
+# Symbol -> asset class / subclass lookups, used to classify whole columns with Series.map
+_FIXED_KEYS = frozenset(_FIXED_META)
+_FIXED_LOOKUP = MappingProxyType({k: v[1:3] for k, v in _FIXED_META.items()})
+_EQ_LOOKUP = MappingProxyType({k: v[1:3] for k, v in _EQ_META.items()})
+_ETF_LOOKUP = MappingProxyType({**_FIXED_LOOKUP, **_EQ_LOOKUP})
+_FIXED_SUB = MappingProxyType({k: v[2] for k, v in _FIXED_META.items()})
+_EQ_ASSET = MappingProxyType({k: v[1] for k, v in _EQ_META.items()})
+
+# Display formats applied by SummaryTool.format_for_display, reports themselves keep numeric columns
+_DISPLAY_FORMATS = {'TOTAL_DOLLARS': '${:,.0f}', 'DOLLARS': '${:,.0f}',
+                    'MAJOR_TOTAL_DOLLARS': '${:,.0f}', 'MINOR_TOTAL_DOLLARS': '${:,.0f}',
+                    'ASSET_CLASS_TOTAL_DOLLARS': '${:,.0f}', 'SUBCLASS_TOTAL_DOLLARS': '${:,.0f}',
+                    'ALLOCATION': '{:.0f}%', 'MAJOR_ALLOCATION': '{:.0f}%', 'MINOR_ALLOCATION': '{:.2f}%',
+                    'ASSET_CLASS_ALLOCATION': '{:.1f}%', 'SUBCLASS_ALLOCATION': '{:.2f}%',
+                    'STOCK_ALLOCATION': '{:.2f}%', 'YIELD': '{:.2f}%'}
+# Outer level columns of the two-level reports, repeated outer values are blanked on display
+_DISPLAY_OUTER_LEVELS = (('MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION'),
+                         ('ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION'))
+
+
+def _lookup_asset_class(v_symbol, v_lookup):
+    """
+    The :function: _lookup_asset_class is used to classify a column of upper-cased symbols with one dict lookup
+        per distinct symbol, returning :column: ASSET_CLASS and SUBCLASS with 'Others' for unknown symbols.
+    """
+    _codes, _symbols = pd.factorize(v_symbol)
+    # Missing symbols are coded -1, which picks the trailing 'Others' row of the table
+    _table = np.array([v_lookup.get(x, ('Others', 'Others')) for x in _symbols] + [('Others', 'Others')],
+                      dtype=object)
+    return pd.DataFrame(_table[_codes], columns=['ASSET_CLASS', 'SUBCLASS'], index=v_symbol.index)
+
+
+def _cached_data(v_source_attr):
+    """
+    The :function: _cached_data is used to memoize a SummaryTool data reader on the instance.
+
+    The dataframe is kept in :attr: _cache keyed on the method name, along with the modified time of the
+    source file named by :attr: v_source_attr, and is read again once that file has been changed.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self):
+            _source_file = getattr(self, v_source_attr)
+            _stamp = os.path.getmtime(_source_file) if os.path.exists(_source_file) else None
+            _cached = self._cache.get(func.__name__)
+            if _cached is None or _cached[0] != _stamp:
+                _cached = (_stamp, func(self))
+                self._cache[func.__name__] = _cached
+            return _cached[1]
+        return wrapper
+    return decorator
+
+
+def _shared_connection(func):
+    """
+    The :function: _shared_connection is used to run a SummaryTool method with a single SQLite connection and read
+    transaction for each db file, shared by every query made inside it.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._eq_request, self._fixed_request:
+            return func(self, *args, **kwargs)
+    return wrapper
+
 
 class SummaryTool(object):
     """
@@ -173,7 +262,49 @@ class SummaryTool(object):
         self.eq_db_file = 'databases/equity.db'
         self.fixed_db_file = 'databases/fixed_income.db'
         self.other_investment_file = 'databases/others.json'
+        self._eq_request = eq_SQLiteRequest(self.eq_db_file)
+        self._fixed_request = fixed_SQLiteRequest(self.fixed_db_file)
+        self._cache = {}
+
+    @_shared_connection
+    def cache_result(self):
+        """Read all source data into the instance cache, so following reports do not query the db files again.
 
+        Returns: :object: SummaryTool.
+
+        """
+        self._get_eq_transactions_data()
+        self._get_eq_positions_data()
+        self._get_fixed_positions_data()
+        self._get_fixed_transactions_data()
+        self._get_other_investment_information()
+        self._get_eq_account_dollars_data()
+        self._get_fixed_allocation_by_type_data()
+        return self
+
+    @staticmethod
+    def format_for_display(v_df):
+        """Format numeric dollar and percentage columns of a report as strings, and blank repeated outer values.
+
+        Args:
+            v_df (object): Pandas dataframe returned by one of the generate_* reports.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        df_output = v_df.copy()
+        for _column, _format in _DISPLAY_FORMATS.items():
+            if _column in df_output.columns and pd.api.types.is_numeric_dtype(df_output[_column]):
+                df_output[_column] = [_format.format(v) for v in df_output[_column].to_numpy()]
+        for _outer_col, _outer_dollars, _outer_allocation in _DISPLAY_OUTER_LEVELS:
+            if _outer_col in df_output.columns:
+                # Reports sort on the outer allocation and then the outer value, so each outer group is contiguous
+                _is_duplicate = df_output[_outer_col].eq(df_output[_outer_col].shift())
+                df_output[_outer_allocation] = df_output[_outer_allocation].mask(_is_duplicate, '')
+                df_output[_outer_dollars] = df_output[_outer_dollars].mask(_is_duplicate, '')
+        return df_output
+
+    @_cached_data('eq_db_file')
     def _get_eq_transactions_data(self):
         """Read data from :table: transactions in SQLite equity.db.
 
@@ -182,17 +313,15 @@ class SummaryTool(object):
         """
         self.logger.info(f'Attempt to retrieve data from :table: transactions in {self.eq_db_file}...')
         try:
-            _this_instance = eq_SQLiteRequest(self.eq_db_file)
-            _this_output = _this_instance.get_table_transactions()
-            df = pd.DataFrame(_this_output,
-                              columns=['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE',
-                                       'DESCRIPTION', 'ACCOUNT', 'TOTAL_DOLLARS']
-                              )
+            df = self._eq_request.get_table_transactions(v_as_frame=True)
+            df['INVESTMENT_TYPE'] = df['INVESTMENT_TYPE'].str.upper()
+            df = df.astype(_EQ_TRANSACTIONS_DTYPES)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :table: transactions in {self.eq_db_file} -> '+str(e))
             raise e
 
+    @_cached_data('eq_db_file')
     def _get_eq_positions_data(self):
         """Read data from :view: positions in SQLite equity.db.
 
@@ -201,18 +330,15 @@ class SummaryTool(object):
         """
         self.logger.info(f'Attempt to retrieve data from :view: positions in {self.eq_db_file}...')
         try:
-            _this_instance = eq_SQLiteRequest(self.eq_db_file)
-            _this_output = _this_instance.get_view_positions()
-            df = pd.DataFrame(_this_output,
-                              columns=['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS',
-                                       'UNITS', 'LAST_UPDATED', 'MKT_VALUE', 'GAIN_PER_SHARE', 'GAIN_TOTAL',
-                                       'GAIN_PERCENTAGE']
-                              )
+            df = self._eq_request.get_view_positions(v_as_frame=True)
+            df['INVESTMENT_TYPE'] = df['INVESTMENT_TYPE'].str.upper()
+            df = df.astype(_EQ_POSITIONS_DTYPES)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :view: positions in {self.eq_db_file} -> '+str(e))
             raise e
 
+    @_cached_data('fixed_db_file')
     def _get_fixed_positions_data(self):
         """Read data from :view: positions in SQLite fixed_income.db.
 
@@ -221,38 +347,59 @@ class SummaryTool(object):
         """
         self.logger.info(f'Attempt to retrieve data from :view: positions in {self.fixed_db_file}...')
         try:
-            _this_instance = fixed_SQLiteRequest(self.fixed_db_file)
-            _this_output = _this_instance.get_view_positions_fixed()
-            df = pd.DataFrame(_this_output,
-                              columns=['NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE', 'TOTAL_DOLLARS',
-                                       'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'RETURN_RATE', 'RETURN_DOLLARS',
-                                       'IS_MATURED']
-                              )
+            df = self._fixed_request.get_view_positions_fixed(v_as_frame=True).astype(_FIXED_POSITIONS_DTYPES)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :view: positions in {self.fixed_db_file} -> '+str(e))
             raise e
 
+    @_cached_data('fixed_db_file')
     def _get_fixed_transactions_data(self):
-        """Read data from :table: transactions in SQLite fixed_income.db.
+        """Read data from :table: transactions in SQLite fixed_income.db, skipping matured rows.
 
         Returns: :object: Pandas dataframe.
 
         """
         self.logger.info(f'Attempt to retrieve data from :table: transactions in {self.fixed_db_file}...')
         try:
-            _this_instance = fixed_SQLiteRequest(self.fixed_db_file)
-            _this_output = _this_instance.get_table_transactions_fixed()
-            df = pd.DataFrame(_this_output,
-                              columns=['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE',
-                                       'TOTAL_DOLLARS', 'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM',
-                                       'ACCOUNT']
-                              )
+            df = self._fixed_request.get_table_transactions_fixed(
+                v_as_frame=True, v_active_only=True).astype(_FIXED_TRANSACTIONS_DTYPES)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :table: transactions in {self.fixed_db_file} -> '+str(e))
             raise e
 
+    @_cached_data('eq_db_file')
+    def _get_eq_account_dollars_data(self):
+        """Read market value held for each ACCOUNT, joined and aggregated in SQLite equity.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        self.logger.info(f'Attempt to retrieve allocation by account from {self.eq_db_file}...')
+        try:
+            df = self._eq_request.get_account_allocation_joined(v_as_frame=True).astype(_EQ_ACCOUNT_DTYPES)
+            return df
+        except Exception as e:
+            self.logger.error(f'Failed to retrieve allocation by account from {self.eq_db_file} -> '+str(e))
+            raise e
+
+    @_cached_data('fixed_db_file')
+    def _get_fixed_allocation_by_type_data(self):
+        """Read total dollars for each INVESTMENT_TYPE, aggregated in SQLite fixed_income.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        self.logger.info(f'Attempt to retrieve allocation by investment type from {self.fixed_db_file}...')
+        try:
+            df = self._fixed_request.get_allocation_by_type_fixed(v_as_frame=True).astype(_FIXED_ALLOCATION_DTYPES)
+            return df
+        except Exception as e:
+            self.logger.error(f'Failed to retrieve allocation by investment type from {self.fixed_db_file} -> '+str(e))
+            raise e
+
+    @_cached_data('other_investment_file')
     def _get_other_investment_information(self):
         """Read data from hard-coded cash_equivalent csv file.
 
@@ -261,120 +408,88 @@ class SummaryTool(object):
         """
         self.logger.info(f'Attempt to retrieve data from {self.other_investment_file}...')
         try:
-            df_input = pd.read_json(self.other_investment_file, orient='records')
-            df_output = pd.DataFrame(df_input,
-                                     columns=['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE',
-                                              'DOLLARS', 'ACCOUNT'])
+            df_output = pd.read_json(self.other_investment_file, orient='records', typ='frame',
+                                     dtype={'DOLLARS': 'float64'}).reindex(
+                columns=['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS', 'ACCOUNT']).astype(
+                _OTHER_INVESTMENT_DTYPES)
             return df_output
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from {self.other_investment_file} -> '+str(e))
             raise e
 
+    def _two_level_allocation_report(self, v_df, v_outer_col, v_inner_col, v_outer_prefix, v_inner_prefix):
+        """Summarize DOLLARS of a tagged frame by an outer and an inner column into an allocation report.
+
+        Args:
+            v_df (object): Pandas dataframe with :column: v_outer_col, v_inner_col and DOLLARS.
+            v_outer_col (str): Column label of the outer level, e.g. MAJOR_TYPE.
+            v_inner_col (str): Column label of the inner level, e.g. MINOR_TYPE.
+            v_outer_prefix (str): Prefix of the outer level total and allocation columns, e.g. MAJOR.
+            v_inner_prefix (str): Prefix of the inner level total and allocation columns, e.g. MINOR.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _outer_dollars, _outer_allocation = f'{v_outer_prefix}_TOTAL_DOLLARS', f'{v_outer_prefix}_ALLOCATION'
+        _inner_dollars, _inner_allocation = f'{v_inner_prefix}_TOTAL_DOLLARS', f'{v_inner_prefix}_ALLOCATION'
+        _columns = [v_outer_col, _outer_dollars, _outer_allocation, v_inner_col, _inner_dollars, _inner_allocation]
+        self.logger.info('Preparing allocation summary ...')
+        df_allocation_report = v_df.groupby(
+            [v_outer_col, v_inner_col], sort=False, observed=True)['DOLLARS'].sum().reset_index(name=_inner_dollars)
+        _total_dollars = df_allocation_report[_inner_dollars].sum()
+        # Outer totals are summed up from the much smaller inner result and broadcast back onto the inner rows,
+        # instead of grouping v_df a second time
+        df_allocation_report[_outer_dollars] = df_allocation_report.groupby(
+            v_outer_col, sort=False, observed=True)[_inner_dollars].transform('sum')
+        df_allocation_report[_outer_allocation] = df_allocation_report[_outer_dollars] / _total_dollars * 100
+        df_allocation_report[_inner_allocation] = df_allocation_report[_inner_dollars] / _total_dollars * 100
+        df_allocation_report = df_allocation_report.sort_values(
+            [_outer_allocation, v_outer_col, _inner_allocation, v_inner_col], ascending=[False, True, False, True])
+        df_total = pd.DataFrame({v_outer_col: ['TOTAL'],
+                                 _outer_dollars: [_total_dollars],
+                                 _outer_allocation: [100.0],
+                                 v_inner_col: [''],
+                                 _inner_dollars: [float('nan')],
+                                 _inner_allocation: [float('nan')]})
+        return pd.concat([df_allocation_report[_columns], df_total], ignore_index=True)
+
+    @_shared_connection
     def generate_allocation_report_type(self):
         """Get allocation report based on investment type.
 
         Return: :object: Pandas dataframe.
 
         """
-
-        def _set_major_investment_type_equity(v_symbol):
-            """Set MAJOR_TYPE based on SYMBOL for Equity entries"""
-            if v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_major_type = 'FIXED_INCOME'
-            else:
-                out_major_type = 'EQUITY'
-            return out_major_type
-
-        def _set_minor_investment_type_equity(v_symbol, v_minor_type):
-            """Set MINOR_TYPE based on SYMBOL and INVESTMENT_TYPE for Equity entries"""
-            if v_minor_type.lower() == 'stock':
-                out_minor_type = 'Individual Stock'
-            elif v_minor_type.lower() == 'etf' and v_symbol.upper() in list(this_equity_funds.keys()):
-                out_minor_type = this_equity_funds.get(v_symbol.upper())[1]
-            elif v_minor_type.lower() == 'etf' and v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_minor_type = this_fixed_income_funds.get(v_symbol.upper())[2]
-            else:
-                out_minor_type = 'Others'
-            return out_minor_type
-
-        def _set_minor_investment_type_others(v_symbol, v_major_type, v_minor_type):
-            """Set MINOR_TYPE based on SYMBOL and MINOR type for Other entries"""
-            if v_minor_type.lower() == 'mutual fund' and v_major_type.lower() == 'fixed_income' and v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_minor_type = this_fixed_income_funds.get(v_symbol.upper())[2]
-            else:
-                out_minor_type = v_minor_type
-            return out_minor_type
-
         self.logger.info('Generating Allocation report based on investment_type ...')
         try:
-            df_eq = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']]
-            df_fixed = self._get_fixed_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'TOTAL_DOLLARS']]
+            df_eq = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']].copy()
+            df_fixed = self._get_fixed_allocation_by_type_data()[['INVESTMENT_TYPE', 'TOTAL_DOLLARS']].copy()
             df_other_investment = self._get_other_investment_information()[['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE',
-                                                                            'MINOR_TYPE', 'DOLLARS']]
+                                                                            'MINOR_TYPE', 'DOLLARS']].copy()
             df_eq.columns = ['SYMBOL', 'MINOR_TYPE', 'DOLLARS']
-            df_fixed.columns = ['SYMBOL', 'MINOR_TYPE', 'DOLLARS']
+            df_fixed.columns = ['MINOR_TYPE', 'DOLLARS']
             df_other_investment.columns = ['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']
+            _eq_symbol = df_eq['SYMBOL'].str.upper()
+            _eq_type = df_eq['MINOR_TYPE']
+            _other_symbol = df_other_investment['SUFFIX'].str.upper()
             self.logger.info('Applying logic to build :column: MAJOR_TYPE ...')
-            df_eq['MAJOR_TYPE'] = df_eq['SYMBOL'].apply(lambda x: _set_major_investment_type_equity(x))
+            df_eq['MAJOR_TYPE'] = np.where(_eq_symbol.isin(_FIXED_KEYS), 'FIXED_INCOME', 'EQUITY')
             df_fixed['MAJOR_TYPE'] = 'FIXED_INCOME'
             self.logger.info('Applying logic to build :column: MINOR_TYPE ...')
-            df_eq['MINOR_TYPE'] = df_eq.apply(
-                lambda x: _set_minor_investment_type_equity(x['SYMBOL'], x['MINOR_TYPE']), axis=1)
-            df_other_investment['MINOR_TYPE'] = df_other_investment.apply(
-                lambda x: _set_minor_investment_type_others(x['SUFFIX'], x['MAJOR_TYPE'], x['MINOR_TYPE']), axis=1)
-            self.logger.info('Preparing allocation summary ...')
-            df_combined = pd.concat([
-                df_eq[['MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']],
-                df_fixed[['MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']],
-                df_other_investment[['MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']]
-            ])
-            df_allocation_major_type = df_combined['DOLLARS'].groupby(
-                df_combined['MAJOR_TYPE']).sum().reset_index(name='MAJOR_TOTAL_DOLLARS')
-            df_allocation_major_type['MAJOR_ALLOCATION'] = (
-                    df_allocation_major_type['MAJOR_TOTAL_DOLLARS'] /
-                    df_allocation_major_type['MAJOR_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_minor_type = df_combined['DOLLARS'].groupby(
-                [df_combined['MAJOR_TYPE'],
-                 df_combined['MINOR_TYPE']]).sum().reset_index(name='MINOR_TOTAL_DOLLARS')
-            df_allocation_minor_type['MINOR_ALLOCATION'] = (
-                    df_allocation_minor_type['MINOR_TOTAL_DOLLARS'] /
-                    df_allocation_minor_type['MINOR_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_report = df_allocation_major_type.merge(df_allocation_minor_type, on='MAJOR_TYPE')
-            df_allocation_report = df_allocation_report.sort_values(
-                ['MAJOR_ALLOCATION', 'MINOR_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION',
-                                              'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION'
-                                              ]].append(
-                {'MAJOR_TYPE': 'TOTAL',
-                    'MAJOR_TOTAL_DOLLARS': df_allocation_report['MINOR_TOTAL_DOLLARS'].sum(),
-                    'MAJOR_ALLOCATION': 100.0,
-                    'MINOR_TYPE': '',
-                    'MINOR_TOTAL_DOLLARS': float('nan'),
-                    'MINOR_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['MAJOR_ALLOCATION'] = df_output['MAJOR_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['MINOR_ALLOCATION'] = df_output['MINOR_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['MAJOR_TOTAL_DOLLARS'] = df_output['MAJOR_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['MINOR_TOTAL_DOLLARS'] = df_output['MINOR_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['MAJOR_IS_DUPLICATE'] = df_output[
-                ['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['MAJOR_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['MAJOR_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['MAJOR_IS_DUPLICATE'])
+            df_eq['MINOR_TYPE'] = np.select(
+                [_eq_type.eq('STOCK'), _eq_type.eq('ETF')],
+                ['Individual Stock', _eq_symbol.map(_EQ_ASSET).fillna(_eq_symbol.map(_FIXED_SUB)).fillna('Others')],
+                default='Others')
+            df_other_investment['MINOR_TYPE'] = df_other_investment['MINOR_TYPE'].mask(
+                (df_other_investment['MINOR_TYPE'].str.lower() == 'mutual fund') &
+                (df_other_investment['MAJOR_TYPE'].str.lower() == 'fixed_income') &
+                _other_symbol.isin(_FIXED_KEYS), _other_symbol.map(_FIXED_SUB))
+            _frames = [df_eq, df_fixed, df_other_investment]
+            df_combined = pd.DataFrame({
+                _column: np.concatenate([x[_column].to_numpy(dtype=object) for x in _frames])
+                for _column in ['MAJOR_TYPE', 'MINOR_TYPE']})
+            df_combined['DOLLARS'] = np.concatenate([x['DOLLARS'].to_numpy(dtype='float64') for x in _frames])
+            return self._two_level_allocation_report(df_combined, 'MAJOR_TYPE', 'MINOR_TYPE', 'MAJOR', 'MINOR')
         except Exception as e:
             self.logger.error('Failed to generate allocation report based on investment_type  -> '+str(e))
             raise e
@@ -387,35 +502,32 @@ class SummaryTool(object):
         """
         self.logger.info('Generating Mature Calender for fixed income investment ...')
         try:
-            df_fixed = self._get_fixed_positions_data()[['SYMBOL', 'END_DATE', 'TOTAL_DOLLARS', 'RETURN_RATE']]
+            df_fixed = self._get_fixed_positions_data()[['SYMBOL', 'END_DATE', 'TOTAL_DOLLARS', 'RETURN_RATE']].copy()
             self.logger.info('Updating Pandas Dataframe column label ...')
             df_fixed.columns = ['SYMBOL', 'MATURE_DATE', 'DOLLARS', 'RETURN_RATE']
-            df_fixed['RETURN'] = df_fixed['DOLLARS']*df_fixed['RETURN_RATE']
+            df_fixed['RETURN'] = df_fixed['DOLLARS'].to_numpy() * df_fixed['RETURN_RATE'].to_numpy()
             self.logger.info('Updating :column: MATURE_DATE format from YYYY-MM-DD to YYYY-MM ...')
-            df_fixed['MATURE_DATE'] = df_fixed['MATURE_DATE'].apply(
-                lambda x: datetime.strptime(datetime.strptime(x, '%Y-%m-%d').strftime('%Y-%m'), '%Y-%m'))
+            df_fixed['MATURE_DATE'] = pd.to_datetime(df_fixed['MATURE_DATE'], format='%Y-%m-%d').values.astype(
+                'datetime64[M]').astype('datetime64[ns]')
+            df_fixed['SYMBOL'] = df_fixed['SYMBOL'].str.replace('n/a', 'CD-renew', regex=False)
             self.logger.info('Calculating total Dollars, Counts, Returns, and average Yield for each MATURE_DATE ...')
-            df_mature_calender = df_fixed.groupby(df_fixed['MATURE_DATE']).agg(
-                {'DOLLARS': ['sum', 'count'],
-                 'RETURN': ['sum'],
-                 'SYMBOL': [lambda x: ', '.join([y.replace('n/a', 'CD-renew') for y in x])]
-                 }).reset_index()
-            df_mature_calender.columns = ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF']
-            df_mature_calender['YIELD'] = df_mature_calender['YIELD']/df_mature_calender['TOTAL_DOLLARS']*100
-            self.logger.info('Filtering Pandas Dataframe to exclude rows with MATURE_DATE < CURRENT_MONTH ...')
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m'), '%Y-%m')
-            _delete_row = df_mature_calender[df_mature_calender['MATURE_DATE'] < _current_month].index
-            df_mature_calender = df_mature_calender.drop(_delete_row)
-            df_mature_calender['MATURE_DATE'] = df_mature_calender['MATURE_DATE'].apply(lambda x: x.strftime('%Y-%m'))
+            df_mature_calender = df_fixed.groupby('MATURE_DATE').agg(
+                TOTAL_DOLLARS=('DOLLARS', 'sum'),
+                TOTAL_COUNT=('DOLLARS', 'count'),
+                YIELD=('RETURN', 'sum'),
+                SYMBOL_REF=('SYMBOL', ', '.join)).reset_index()
+            _yield = df_mature_calender['YIELD'].to_numpy(dtype='float64', copy=True)
+            np.divide(_yield, df_mature_calender['TOTAL_DOLLARS'].to_numpy(dtype='float64'), out=_yield)
+            np.multiply(_yield, 100, out=_yield)
+            df_mature_calender['YIELD'] = _yield
+            df_mature_calender['MATURE_DATE'] = df_mature_calender['MATURE_DATE'].dt.strftime('%Y-%m')
             df_output = df_mature_calender.sort_values('MATURE_DATE', ascending=True).reset_index(drop=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['TOTAL_DOLLARS'] = df_output['TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['YIELD'] = df_output['YIELD'].map('{:.2f}%'.format)
             return df_output
         except Exception as e:
             self.logger.error('Failed to generate Mature Calender for fixed income investment  -> '+str(e))
             raise e
 
+    @_shared_connection
     def generate_allocation_report_account(self):
         """Get allocation report based on Broker(Account).
 
@@ -424,37 +536,20 @@ class SummaryTool(object):
         """
         self.logger.info('Generating Allocation report based on ACCOUNT ...')
         try:
-            df_eq_positions = self._get_eq_positions_data()[['SYMBOL', 'DOLLARS']]
-            df_eq_transactions = self._get_eq_transactions_data()[['SYMBOL', 'TYPE', 'UNITS', 'ACCOUNT']]
-            df_eq_transactions['UNITS'].loc[df_eq_transactions['TYPE'] == 'SELL'] = -1*df_eq_transactions['UNITS']
-            df_eq_aggregated_transactions = df_eq_transactions.groupby(
-                ['ACCOUNT', 'SYMBOL'])['UNITS'].sum().reset_index(name='TOTAL_UNITS')
-            df_eq_aggregated_transactions.drop(
-                df_eq_aggregated_transactions[df_eq_aggregated_transactions['TOTAL_UNITS'] <= 0].index,
-                inplace=True)
-            df_eq_combined = df_eq_aggregated_transactions.merge(df_eq_positions, left_on='SYMBOL', right_on='SYMBOL')
-            df_eq_combined['TOTAL_DOLLARS'] = df_eq_combined['DOLLARS']*df_eq_combined['TOTAL_UNITS']
-            df_eq = df_eq_combined.groupby(['ACCOUNT'])['TOTAL_DOLLARS'].sum().reset_index(name='DOLLARS')
-            df_fixed = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'END_DATE', 'ACCOUNT']]
-            df_fixed.columns = ['DOLLARS', 'END_DATE', 'ACCOUNT']
-            df_fixed['END_DATE'] = df_fixed['END_DATE'].apply(lambda x: datetime.strptime(x, '%Y-%m-%d'))
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m-%d'), '%Y-%m-%d')
-            _delete_row = df_fixed[df_fixed['END_DATE'] < _current_month].index
-            df_fixed = df_fixed.drop(_delete_row)
+            df_eq = self._get_eq_account_dollars_data()[['ACCOUNT', 'TOTAL_DOLLARS']]
+            df_eq.columns = ['ACCOUNT', 'DOLLARS']
+            df_fixed = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'ACCOUNT']]
+            df_fixed.columns = ['DOLLARS', 'ACCOUNT']
             df_other_investment = self._get_other_investment_information()[['ACCOUNT', 'DOLLARS']]
-            df_combined = pd.concat([
-                df_eq[['ACCOUNT', 'DOLLARS']],
-                df_fixed[['ACCOUNT', 'DOLLARS']],
-                df_other_investment[['ACCOUNT', 'DOLLARS']]
-            ])
-            df_allocation_account = df_combined['DOLLARS'].groupby(
-                df_combined['ACCOUNT']).sum().reset_index(name='TOTAL_DOLLARS')
+            _frames = [df_eq, df_fixed, df_other_investment]
+            df_combined = pd.DataFrame({
+                'ACCOUNT': np.concatenate([x['ACCOUNT'].to_numpy(dtype=object) for x in _frames]),
+                'DOLLARS': np.concatenate([x['DOLLARS'].to_numpy(dtype='float64') for x in _frames])})
+            df_allocation_account = df_combined.groupby(
+                'ACCOUNT', sort=False, observed=True)['DOLLARS'].sum().reset_index(name='TOTAL_DOLLARS')
             df_allocation_account['ALLOCATION'] = (
                     df_allocation_account['TOTAL_DOLLARS'] / df_allocation_account['TOTAL_DOLLARS'].sum() * 100)
-            df_output = df_allocation_account.sort_values('ALLOCATION', ascending=False)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ALLOCATION'] = df_output['ALLOCATION'].map('{:.0f}%'.format)
-            df_output['TOTAL_DOLLARS'] = df_output['TOTAL_DOLLARS'].map('${:,.0f}'.format)
+            df_output = df_allocation_account.sort_values(['ALLOCATION', 'ACCOUNT'], ascending=[False, True])
             return df_output
         except Exception as e:
             self.logger.error('Failed to generate Allocation report based on ACCOUNT  -> '+str(e))
@@ -467,71 +562,14 @@ class SummaryTool(object):
         Return: :object: Pandas DataFrame.
 
         """
-        def _set_equity_etf_asset_class(v_symbol, v_index):
-            """Set Equity ETF Asset Class based on SYMBOL"""
-            if v_symbol.upper() in list(this_equity_funds.keys()):
-                out_asset_class = this_equity_funds.get(v_symbol.upper())[v_index]
-            else:
-                out_asset_class = 'Others'
-            return out_asset_class
-
         self.logger.info('Generating Allocation report for Equity ETF ...')
         try:
-            # Disable pandas warning message
-            pd.options.mode.chained_assignment = None
             df_eq = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']]
             df_eq.columns = ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']
-            df_combined = df_eq[((df_eq['INVESTMENT_TYPE'] == 'ETF') | (df_eq['INVESTMENT_TYPE'] == 'etf')) &
-                                (~df_eq['SYMBOL'].isin(list(this_fixed_income_funds.keys())))]
-            df_combined['ASSET_CLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_equity_etf_asset_class(x, 1))
-            df_combined['SUBCLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_equity_etf_asset_class(x, 2))
-            df_allocation_class = df_combined['DOLLARS'].groupby(
-                df_combined['ASSET_CLASS']).sum().reset_index(name='ASSET_CLASS_TOTAL_DOLLARS')
-            df_allocation_class['ASSET_CLASS_ALLOCATION'] = (
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'] /
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_subclass = df_combined['DOLLARS'].groupby(
-                [df_combined['ASSET_CLASS'],
-                 df_combined['SUBCLASS']]).sum().reset_index(name='SUBCLASS_TOTAL_DOLLARS')
-            df_allocation_subclass['SUBCLASS_ALLOCATION'] = (
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'] /
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_report = df_allocation_class.merge(df_allocation_subclass, on='ASSET_CLASS')
-            df_allocation_report = df_allocation_report.sort_values(
-                ['ASSET_CLASS_ALLOCATION', 'SUBCLASS_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
-                                              'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'
-                                              ]].append(
-                {'ASSET_CLASS': 'TOTAL',
-                 'ASSET_CLASS_TOTAL_DOLLARS': df_allocation_report['SUBCLASS_TOTAL_DOLLARS'].sum(),
-                 'ASSET_CLASS_ALLOCATION': 100.0,
-                 'SUBCLASS': '',
-                 'SUBCLASS_TOTAL_DOLLARS': float('nan'),
-                 'SUBCLASS_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output['ASSET_CLASS_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['SUBCLASS_ALLOCATION'] = df_output['SUBCLASS_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output['ASSET_CLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['SUBCLASS_TOTAL_DOLLARS'] = df_output['SUBCLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['ASSET_CLASS_IS_DUPLICATE'] = df_output[
-                ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['ASSET_CLASS_IS_DUPLICATE'])
+            df_combined = df_eq[df_eq['INVESTMENT_TYPE'].eq('ETF') & ~df_eq['SYMBOL'].isin(_FIXED_KEYS)].copy()
+            df_combined[['ASSET_CLASS', 'SUBCLASS']] = _lookup_asset_class(df_combined['SYMBOL'].str.upper(),
+                                                                           _EQ_LOOKUP)
+            return self._two_level_allocation_report(df_combined, 'ASSET_CLASS', 'SUBCLASS', 'ASSET_CLASS', 'SUBCLASS')
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Equity ETF -> '+str(e))
             raise e
@@ -542,70 +580,14 @@ class SummaryTool(object):
         Return: :object: Pandas DataFrame.
 
         """
-        def _set_fixed_etf_asset_class(v_symbol, v_index):
-            """Set Fixed Income ETF Asset Class based on SYMBOL"""
-            if v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_asset_class = this_fixed_income_funds.get(v_symbol.upper())[v_index]
-            else:
-                out_asset_class = 'Others'
-            return out_asset_class
-
         self.logger.info('Generating Allocation report for Fixed Income ETF ...')
         try:
-            pd.options.mode.chained_assignment = None
             df_fixed = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']]
             df_fixed.columns = ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']
-            df_combined = df_fixed[((df_fixed['INVESTMENT_TYPE'] == 'ETF') | (df_fixed['INVESTMENT_TYPE'] == 'etf')) &
-                                   (df_fixed['SYMBOL'].isin(list(this_fixed_income_funds.keys())))]
-            df_combined['ASSET_CLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_fixed_etf_asset_class(x, 1))
-            df_combined['SUBCLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_fixed_etf_asset_class(x, 2))
-            df_allocation_class = df_combined['DOLLARS'].groupby(
-                df_combined['ASSET_CLASS']).sum().reset_index(name='ASSET_CLASS_TOTAL_DOLLARS')
-            df_allocation_class['ASSET_CLASS_ALLOCATION'] = (
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'] /
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_subclass = df_combined['DOLLARS'].groupby(
-                [df_combined['ASSET_CLASS'],
-                 df_combined['SUBCLASS']]).sum().reset_index(name='SUBCLASS_TOTAL_DOLLARS')
-            df_allocation_subclass['SUBCLASS_ALLOCATION'] = (
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'] /
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_report = df_allocation_class.merge(df_allocation_subclass, on='ASSET_CLASS')
-            df_allocation_report = df_allocation_report.sort_values(
-                ['ASSET_CLASS_ALLOCATION', 'SUBCLASS_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
-                                              'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'
-                                              ]].append(
-                {'ASSET_CLASS': 'TOTAL',
-                 'ASSET_CLASS_TOTAL_DOLLARS': df_allocation_report['SUBCLASS_TOTAL_DOLLARS'].sum(),
-                 'ASSET_CLASS_ALLOCATION': 100.0,
-                 'SUBCLASS': '',
-                 'SUBCLASS_TOTAL_DOLLARS': float('nan'),
-                 'SUBCLASS_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output['ASSET_CLASS_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['SUBCLASS_ALLOCATION'] = df_output['SUBCLASS_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output['ASSET_CLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['SUBCLASS_TOTAL_DOLLARS'] = df_output['SUBCLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['ASSET_CLASS_IS_DUPLICATE'] = df_output[
-                ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['ASSET_CLASS_IS_DUPLICATE'])
+            df_combined = df_fixed[df_fixed['INVESTMENT_TYPE'].eq('ETF') & df_fixed['SYMBOL'].isin(_FIXED_KEYS)].copy()
+            df_combined[['ASSET_CLASS', 'SUBCLASS']] = _lookup_asset_class(df_combined['SYMBOL'].str.upper(),
+                                                                           _FIXED_LOOKUP)
+            return self._two_level_allocation_report(df_combined, 'ASSET_CLASS', 'SUBCLASS', 'ASSET_CLASS', 'SUBCLASS')
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Fixed Income ETF -> '+str(e))
             raise e
@@ -619,149 +601,70 @@ class SummaryTool(object):
         """
         self.logger.info('Generating Allocation report for Equity Stock ...')
         try:
-            pd.options.mode.chained_assignment = None
             df_eq = self._get_eq_positions_data()[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'MKT_VALUE']]
             df_eq.columns = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'DOLLARS']
-            df_allocation_report = df_eq[((df_eq['INVESTMENT_TYPE'] == 'STOCK') | (df_eq['INVESTMENT_TYPE'] == 'stock'))
-                                         & ~(df_eq['SYMBOL'].isin(['GPRO']))]
-            df_allocation_report['STOCK_ALLOCATION'] = (
-                    df_allocation_report['DOLLARS'] / df_allocation_report['DOLLARS'].sum() * 100)
+            _is_stock = (df_eq['INVESTMENT_TYPE'].to_numpy() == 'STOCK') & (df_eq['SYMBOL'].to_numpy() != 'GPRO')
+            df_allocation_report = df_eq[_is_stock].copy()
+            _total_dollars = df_allocation_report['DOLLARS'].sum()
+            df_allocation_report['STOCK_ALLOCATION'] = df_allocation_report['DOLLARS'] / _total_dollars * 100
             df_allocation_report = df_allocation_report.sort_values(['STOCK_ALLOCATION'], ascending=False)[
                 ['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION']]
-            df_output = df_allocation_report[['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION'
-                                              ]].append(
-                {'SYMBOL': 'TOTAL',
-                 'DESCRIPTION': 'N/A',
-                 'DOLLARS': df_allocation_report['DOLLARS'].sum(),
-                 'STOCK_ALLOCATION': 100.0
-                 }, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['STOCK_ALLOCATION'] = df_output['STOCK_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['DOLLARS'] = df_output['DOLLARS'].map('${:,.0f}'.format)
+            df_total = pd.DataFrame({'SYMBOL': ['TOTAL'],
+                                     'DESCRIPTION': ['N/A'],
+                                     'DOLLARS': [_total_dollars],
+                                     'STOCK_ALLOCATION': [100.0]})
+            df_output = pd.concat([df_allocation_report, df_total], ignore_index=True)
             return df_output
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Equity Stock -> '+str(e))
             raise e
 
+    @_shared_connection
     def generate_allocation_report_etf_w_account(self, v_account):
         """Get allocation report for Equity ETF.
 
         Return: :object: Pandas DataFrame.
 
         """
-        def _set_asset_class(v_symbol, v_index):
-            """Set ETF Asset Class based on SYMBOL"""
-            if v_symbol.upper() in list(this_equity_funds.keys()):
-                out_asset_class = this_equity_funds.get(v_symbol.upper())[v_index]
-            elif v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_asset_class = this_fixed_income_funds.get(v_symbol.upper())[v_index]
-            else:
-                out_asset_class = 'Others'
-            return out_asset_class
-
         self.logger.info('Generating Allocation report for Equity ETF, group by account ...')
         try:
-            pd.options.mode.chained_assignment = None
             df_transactions = self._get_eq_transactions_data()[['SYMBOL', 'ACCOUNT', 'TYPE', 'UNITS']]
-            df_transactions['ADJUSTED_UNITS'] = np.where(df_transactions['TYPE'] == 'BUY',
-                                                         df_transactions['UNITS'],
-                                                         -1 * df_transactions['UNITS'])
-            df_positions = self._get_eq_positions_data()[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'DOLLARS']]
+            df_transactions = df_transactions[df_transactions['ACCOUNT'] == v_account].copy()
+            _units = df_transactions['UNITS'].to_numpy(dtype='float64')
+            df_transactions['ADJUSTED_UNITS'] = np.where(df_transactions['TYPE'].to_numpy() == 'BUY', _units, -_units)
+            df_positions = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']]
             df_other_investment = self._get_other_investment_information()[['SUFFIX', 'MAJOR_TYPE', 'MINOR_TYPE',
                                                                             'ACCOUNT', 'DOLLARS']]
             df_cash_equivalent = df_other_investment[(df_other_investment['ACCOUNT'] == v_account) &
-                                                     (df_other_investment['MAJOR_TYPE'] == 'Cash Equivalent'
-                                                      )].groupby(['MAJOR_TYPE'])['DOLLARS'].sum().\
-                reset_index(name='TOTAL_DOLLARS')
+                                                     (df_other_investment['MAJOR_TYPE'] == 'Cash Equivalent')].groupby(
+                'MAJOR_TYPE', sort=False, observed=True)['DOLLARS'].sum().reset_index(name='TOTAL_DOLLARS')
             df_cash_equivalent.columns = ['ASSET_CLASS', 'DOLLARS']
             df_mutual_fund = df_other_investment[(df_other_investment['ACCOUNT'] == v_account) &
                                                  (df_other_investment['MAJOR_TYPE'] != 'Cash Equivalent')]
             df_mutual_fund.columns = ['SYMBOL', 'MAJOR_TYPE', 'INVESTMENT_TYPE', 'ACCOUNT', 'DOLLARS']
-            df_fixed_trans = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'END_DATE', 'INVESTMENT_TYPE', 'ACCOUNT']]
-            df_fixed_trans.columns = ['DOLLARS', 'END_DATE', 'TYPE', 'ACCOUNT']
-            df_fixed_trans['END_DATE'] = df_fixed_trans['END_DATE'].apply(lambda x: datetime.strptime(x, '%Y-%m-%d'))
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m-%d'), '%Y-%m-%d')
-            _delete_row = df_fixed_trans[df_fixed_trans['END_DATE'] < _current_month].index
-            df_fixed_trans = df_fixed_trans.drop(_delete_row)
+            df_fixed_trans = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'INVESTMENT_TYPE', 'ACCOUNT']]
+            df_fixed_trans.columns = ['DOLLARS', 'TYPE', 'ACCOUNT']
             df_fixed = df_fixed_trans[(df_fixed_trans['ACCOUNT'] == v_account)][['DOLLARS', 'TYPE']]
-            df_fixed_final = df_fixed['DOLLARS'].groupby(
-                df_fixed['TYPE']).sum().reset_index()
-            df_eq = df_transactions.groupby(['SYMBOL', 'ACCOUNT'])['ADJUSTED_UNITS'].sum().\
-                reset_index(name='TOTAL_UNITS').query('TOTAL_UNITS > 0').\
-                join(df_positions.set_index('SYMBOL'), on='SYMBOL')
-            df_eq['TOTAL_DOLLARS'] = df_eq['TOTAL_UNITS'] * df_eq['DOLLARS']
-            df_final = df_eq[(df_eq['ACCOUNT'] == v_account)][['SYMBOL', 'INVESTMENT_TYPE', 'TOTAL_DOLLARS']]
+            df_fixed_final = df_fixed.groupby('TYPE', sort=False, observed=True)['DOLLARS'].sum().reset_index()
+            df_units = df_transactions.groupby('SYMBOL', sort=False, observed=True)['ADJUSTED_UNITS'].sum().\
+                reset_index(name='TOTAL_UNITS')
+            df_eq = df_units[df_units['TOTAL_UNITS'].to_numpy() > 0].merge(df_positions, on='SYMBOL', how='left')
+            df_eq['TOTAL_DOLLARS'] = df_eq['TOTAL_UNITS'].to_numpy() * df_eq['DOLLARS'].to_numpy()
+            df_final = df_eq[['SYMBOL', 'INVESTMENT_TYPE', 'TOTAL_DOLLARS']]
             df_final.columns = ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']
-            df_combined = df_final[((df_final['INVESTMENT_TYPE'] == 'ETF') | (df_final['INVESTMENT_TYPE'] == 'etf'))]
-            df_combined = df_combined.append(df_mutual_fund[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']], ignore_index=True)
-            df_combined['ASSET_CLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_asset_class(x, 1))
-            df_combined['SUBCLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_asset_class(x, 2))
-            if df_cash_equivalent.shape[0] > 0:
-                df_cash_equivalent['SYMBOL'] = 'n/a'
-                df_cash_equivalent['INVESTMENT_TYPE'] = 'Cash'
-                df_cash_equivalent['SUBCLASS'] = 'Cash'
-                df_combined = df_combined.append(df_cash_equivalent[[
-                    'SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS', 'ASSET_CLASS', 'SUBCLASS']], ignore_index=True)
-            if df_fixed_final.shape[0] > 0:
-                df_fixed_final['SYMBOL'] = 'n/a'
-                df_fixed_final['ASSET_CLASS'] = 'Fixed Income'
-                df_fixed_final['INVESTMENT_TYPE'] = 'Bond/CD'
-                df_fixed_final['SUBCLASS'] = df_fixed_final['TYPE']
-                # dev
-                print('test...')
-                print(df_fixed_final)
-                df_combined = df_combined.append(df_fixed_final[[
-                    'SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS', 'ASSET_CLASS', 'SUBCLASS']], ignore_index=True)
-                # dev
-                print('test...')
-                print(df_combined)
-            df_allocation_class = df_combined['DOLLARS'].groupby(
-                df_combined['ASSET_CLASS']).sum().reset_index(name='ASSET_CLASS_TOTAL_DOLLARS')
-            df_allocation_class['ASSET_CLASS_ALLOCATION'] = (
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'] /
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_subclass = df_combined['DOLLARS'].groupby(
-                [df_combined['ASSET_CLASS'],
-                 df_combined['SUBCLASS']]).sum().reset_index(name='SUBCLASS_TOTAL_DOLLARS')
-            df_allocation_subclass['SUBCLASS_ALLOCATION'] = (
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'] /
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_report = df_allocation_class.merge(df_allocation_subclass, on='ASSET_CLASS')
-            df_allocation_report = df_allocation_report.sort_values(
-                ['ASSET_CLASS_ALLOCATION', 'SUBCLASS_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
-                                              'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'
-                                              ]].append(
-                {'ASSET_CLASS': 'TOTAL',
-                 'ASSET_CLASS_TOTAL_DOLLARS': df_allocation_report['SUBCLASS_TOTAL_DOLLARS'].sum(),
-                 'ASSET_CLASS_ALLOCATION': 100.0,
-                 'SUBCLASS': '',
-                 'SUBCLASS_TOTAL_DOLLARS': float('nan'),
-                 'SUBCLASS_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output['ASSET_CLASS_ALLOCATION'].map('{:.1f}%'.format)
-            df_output['SUBCLASS_ALLOCATION'] = df_output['SUBCLASS_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output['ASSET_CLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['SUBCLASS_TOTAL_DOLLARS'] = df_output['SUBCLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['ASSET_CLASS_IS_DUPLICATE'] = df_output[
-                ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['ASSET_CLASS_IS_DUPLICATE'])
+            df_combined = df_final[df_final['INVESTMENT_TYPE'].eq('ETF')]
+            df_combined = pd.concat([df_combined, df_mutual_fund[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']]],
+                                    ignore_index=True)
+            _classes = _lookup_asset_class(df_combined['SYMBOL'].str.upper(), _ETF_LOOKUP)
+            df_combined = df_combined.assign(ASSET_CLASS=_classes['ASSET_CLASS'], SUBCLASS=_classes['SUBCLASS'])
+            df_cash_equivalent = df_cash_equivalent.assign(SYMBOL='n/a', INVESTMENT_TYPE='Cash', SUBCLASS='Cash')
+            df_fixed_final = df_fixed_final.assign(SYMBOL='n/a', ASSET_CLASS='Fixed Income', INVESTMENT_TYPE='Bond/CD',
+                                                   SUBCLASS=df_fixed_final['TYPE'])
+            # Empty cash or fixed income frames add no rows, so both are always stacked on the ETF holdings
+            _columns = ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS', 'ASSET_CLASS', 'SUBCLASS']
+            df_combined = pd.concat([df_combined, df_cash_equivalent[_columns], df_fixed_final[_columns]],
+                                    ignore_index=True)
+            return self._two_level_allocation_report(df_combined, 'ASSET_CLASS', 'SUBCLASS', 'ASSET_CLASS', 'SUBCLASS')
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Equity ETF group by Account -> '+str(e))
             raise e
@@ -318,3 +318,95 @@ class TestSQLiteRequests(unittest.TestCase):
             self.assertEqual(float(test_output[0]['GAIN_PERCENTAGE']), 0.1)
         except Exception as e:
             self.fail(":function: get_view_positions() raised exception unexpectedly ! -> " + str(e))
+
+    def test_get_table_transactions_frame(self):
+        """
+        TestCase for SQLiteRequest.get_table_transactions(v_as_frame=True).
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        try:
+            test_output = _test_instance.get_table_transactions(v_as_frame=True)
+            self.assertEqual(list(test_output.columns), ['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS',
+                                                         'INVESTMENT_TYPE', 'DESCRIPTION', 'ACCOUNT', 'TOTAL_DOLLARS'])
+            self.assertEqual(test_output.shape[0], 1)
+            self.assertEqual(test_output.iloc[0]['SYMBOL'], 'AAPL')
+            self.assertEqual(float(test_output.iloc[0]['TOTAL_DOLLARS']), 2000.0)
+        except Exception as e:
+            self.fail(":function: get_table_transactions() raised exception unexpectedly ! -> " + str(e))
+
+    def test_shared_connection(self):
+        """
+        TestCase for SQLiteRequest.__enter__() and SQLiteRequest.__exit__().
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        with _test_instance:
+            self.assertIsNone(_test_instance._shared_conn)
+            self.assertEqual(len(_test_instance.get_table_transactions()), 1)
+            _test_conn = _test_instance._shared_conn
+            self.assertIsNotNone(_test_conn)
+            with _test_instance:
+                self.assertEqual(len(_test_instance.get_table_transactions()), 1)
+            self.assertIs(_test_instance._shared_conn, _test_conn)
+        self.assertIsNone(_test_instance._shared_conn)
+
+    def test_get_account_allocation_joined(self):
+        """
+        TestCase for SQLiteRequest.get_account_allocation_joined().
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('AAPL', 'SELL', '2019-01-31', 210.0, 4, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.create_table_watch_list()
+        _test_instance.sync_table_watch_list()
+        _test_instance.update_table_watch_list('AAPL', 'Apple Inc.', 'stock', 220.0, 140.0, 240.0,
+                                               100000000000, 0, 22.0, 18.0, 0.015, float('nan'), 3.05, float('nan'),
+                                               1.21, 0.0042999, 'Technology', '')
+        _test_instance.create_table_holdings()
+        _test_instance.sync_table_holdings()
+        _test_instance.create_view_positions()
+        try:
+            test_output = _test_instance.get_account_allocation_joined()
+            self.assertEqual(len(test_output), 1)
+            self.assertEqual(test_output[0]['ACCOUNT'], 'TD')
+            self.assertEqual(float(test_output[0]['TOTAL_DOLLARS']), 1320.0)
+        except Exception as e:
+            self.fail(":function: get_account_allocation_joined() raised exception unexpectedly ! -> " + str(e))
+
+    def test_get_account_allocation_joined_unpriced(self):
+        """
+        TestCase for SQLiteRequest.get_account_allocation_joined() with an account holding no priced SYMBOL.
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('MSFT', 'BUY', '2018-12-31', 100.0, 5, 'stock', 'RRSP',
+                                                      'Microsoft Corp')
+        _test_instance.create_table_watch_list()
+        _test_instance.sync_table_watch_list()
+        _test_instance.update_table_watch_list('AAPL', 'Apple Inc.', 'stock', 220.0, 140.0, 240.0,
+                                               100000000000, 0, 22.0, 18.0, 0.015, float('nan'), 3.05, float('nan'),
+                                               1.21, 0.0042999, 'Technology', '')
+        _test_instance.create_table_holdings()
+        _test_instance.sync_table_holdings()
+        _test_instance.create_view_positions()
+        try:
+            test_output = {row['ACCOUNT']: row['TOTAL_DOLLARS'] for row in
+                           _test_instance.get_account_allocation_joined()}
+            self.assertEqual(test_output['RRSP'], 0.0)
+            self.assertEqual(test_output['TD'], 2200.0)
+        except Exception as e:
+            self.fail(":function: get_account_allocation_joined() raised exception unexpectedly ! -> " + str(e))
@@ -15,11 +15,38 @@ Examples:
 
 """
 
+import asyncio
+import threading
+import time
 import unittest
-from src.financial_API_utility import Stock, ETF
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, PropertyMock, MagicMock
+from src.financial_API_utility import Stock, ETF, Stocks, ETFs, QuoteBatch, AsyncStock, to_frame, \
+    fetch_portfolio, _TTLCache, _get_disk_cache, _clear_credentials, _INFO_CACHE, _BAD_TICKERS, _QUOTE_RESULTS, \
+    _CREDENTIALS
 
 
 class TestFinAPI(unittest.TestCase):
+    def setUp(self):
+        """
+        disable the disk cache and clear the in-process caches before each TestCase executed, so mocked info
+        dictionaries are never reused.
+        """
+        _INFO_CACHE.clear()
+        _BAD_TICKERS.clear()
+        _QUOTE_RESULTS.clear()
+        self._patcher_disk_cache = patch('src.financial_API_utility._get_disk_cache', return_value=None)
+        self.mock_get_disk_cache = self._patcher_disk_cache.start()
+
+    def tearDown(self):
+        """
+        restore the disk cache after each TestCase finished.
+        """
+        self._patcher_disk_cache.stop()
+        _INFO_CACHE.clear()
+        _BAD_TICKERS.clear()
+        _QUOTE_RESULTS.clear()
+
     def test_init_stock(self):
         """
         TestCase for Stock.__init__().
@@ -32,6 +59,31 @@ class TestFinAPI(unittest.TestCase):
         except RuntimeError:
             self.fail(":class: Stock failed to initialize !")
 
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_info_cached(self, mock_ticker):
+        """
+        TestCase for Stock._get_info().
+        """
+        _mock_info = PropertyMock(return_value={'fiftyTwoWeekLow': 100.0, 'fiftyTwoWeekHigh': 200.0})
+        type(mock_ticker.return_value).info = _mock_info
+        _test_stock_instance = Stock('AAPL')
+        self.assertEqual(_test_stock_instance.get_low_52wks(), 100.0)
+        self.assertEqual(_test_stock_instance.get_high_52wks(), 200.0)
+        self.assertEqual(_mock_info.call_count, 1)
+        self.assertTrue(mock_ticker.call_args[1]['session'] is not None)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_field_default(self, mock_ticker):
+        """
+        TestCase for Stock._field().
+        """
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'marketCap': None, 'sector': 'Technology'})
+        _test_stock_instance = Stock('AAPL')
+        self.assertEqual(_test_stock_instance.get_market_cap(), 0)
+        self.assertEqual(_test_stock_instance.get_sector(), 'Technology')
+        self.assertEqual(_test_stock_instance.get_name(), '')
+        self.assertTrue(_test_stock_instance.get_beta() != _test_stock_instance.get_beta())
+
     def test_get_previous_close_stock(self):
         """
         TestCase for Stock.get_previous_close().
@@ -284,4 +336,375 @@ class TestFinAPI(unittest.TestCase):
             _test_output = _test_stock_instance.get_fund_family()
             self.assertTrue(isinstance(_test_output, str))
         except RuntimeError:
-            self.fail(":function: get_fund_family() raised RuntimeError unexpectedly !")
\ No newline at end of file
+            self.fail(":function: get_fund_family() raised RuntimeError unexpectedly !")
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_field_stocks(self, mock_ticker):
+        """
+        TestCase for Stocks.get_field().
+        """
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'marketCap': 1000})
+        _test_batch_instance = Stocks(['AAPL', 'MSFT'])
+        self.assertEqual(list(_test_batch_instance.this_instances.keys()), ['AAPL', 'MSFT'])
+        self.assertEqual(_test_batch_instance.get_field('get_market_cap'), {'AAPL': 1000, 'MSFT': 1000})
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_field_etfs(self, mock_ticker):
+        """
+        TestCase for ETFs.get_field().
+        """
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'category': 'Large Blend'})
+        _test_batch_instance = ETFs(['VOO', 'IVV'])
+        self.assertTrue(isinstance(_test_batch_instance.this_instances['VOO'], ETF))
+        self.assertEqual(_test_batch_instance.get_field('get_category'), {'VOO': 'Large Blend', 'IVV': 'Large Blend'})
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'test'})
+    @patch('src.financial_API_utility.yf.Ticker')
+    @patch('src.financial_API_utility._SHARED_SESSION.get')
+    def test_fetch_quote_batch(self, mock_session_get, mock_ticker):
+        """
+        TestCase for QuoteBatch.fetch().
+        """
+        _mock_response = MagicMock()
+        _mock_response.json.return_value = {'quoteResponse': {'result': [
+            {'symbol': 'AAPL', 'marketCap': 1000, 'regularMarketPreviousClose': 100.0},
+            {'symbol': 'MSFT', 'marketCap': 2000, 'regularMarketPreviousClose': 200.0}
+        ]}}
+        mock_session_get.return_value = _mock_response
+        _mock_info = PropertyMock(return_value={'sector': 'Technology'})
+        type(mock_ticker.return_value).info = _mock_info
+        _test_output = QuoteBatch.fetch(['AAPL', 'MSFT'])
+        self.assertEqual(mock_session_get.call_count, 1)
+        self.assertEqual(mock_session_get.call_args[1]['params']['symbols'], 'AAPL,MSFT')
+        self.assertEqual(_test_output['MSFT']['marketCap'], 2000)
+        _test_stock_instance = Stock('AAPL')
+        self.assertEqual(_test_stock_instance.get_market_cap(), 1000)
+        self.assertEqual(_mock_info.call_count, 0)
+        self.assertEqual(_test_stock_instance.get_sector(), 'Technology')
+        self.assertEqual(_mock_info.call_count, 1)
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'test'})
+    @patch.object(Stock, '_get_info')
+    @patch('src.financial_API_utility.yf.Ticker')
+    @patch('src.financial_API_utility._SHARED_SESSION.get')
+    def test_fetch_quote_batch_aliases(self, mock_session_get, mock_ticker, mock_get_info):
+        """
+        TestCase for Stock getters served from QuoteBatch.fetch() records stored under a different key.
+        """
+        _mock_response = MagicMock()
+        _mock_response.json.return_value = {'quoteResponse': {'result': [
+            {'symbol': 'AAPL', 'regularMarketPreviousClose': 100.0, 'epsTrailingTwelveMonths': 5.0, 'epsForward': 6.0}
+        ]}}
+        mock_session_get.return_value = _mock_response
+        QuoteBatch.fetch(['AAPL'])
+        _test_stock_instance = Stock('aapl')
+        self.assertEqual(_test_stock_instance.get_previous_close(), 100.0)
+        self.assertEqual(_test_stock_instance.get_eps(), 5.0)
+        self.assertEqual(_test_stock_instance.get_forward_eps(), 6.0)
+        self.assertFalse(mock_get_info.called)
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'test'})
+    @patch('src.financial_API_utility.time.monotonic')
+    @patch('src.financial_API_utility.yf.Ticker')
+    @patch('src.financial_API_utility._SHARED_SESSION.get')
+    def test_fetch_quote_batch_expired(self, mock_session_get, mock_ticker, mock_monotonic):
+        """
+        TestCase for QuoteBatch.fetch() records expired after the TTL.
+        """
+        _mock_response = MagicMock()
+        _mock_response.json.return_value = {'quoteResponse': {'result': [{'symbol': 'AAPL', 'marketCap': 1000}]}}
+        mock_session_get.return_value = _mock_response
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'marketCap': 2000})
+        mock_monotonic.return_value = 0.0
+        QuoteBatch.fetch(['AAPL'])
+        self.assertEqual(Stock('AAPL').get_market_cap(), 1000)
+        mock_monotonic.return_value = 301.0
+        self.assertEqual(Stock('AAPL').get_market_cap(), 2000)
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'expired'})
+    @patch('src.financial_API_utility._SHARED_SESSION.get')
+    def test_fetch_quote_batch_crumb_rejected(self, mock_session_get):
+        """
+        TestCase for QuoteBatch.fetch() with a crumb rejected by Yahoo Finance.
+        """
+        _mock_rejected = MagicMock(status_code=401)
+        _mock_cookie = MagicMock(status_code=200)
+        _mock_crumb = MagicMock(status_code=200, text='renewed')
+        _mock_response = MagicMock(status_code=200)
+        _mock_response.json.return_value = {'quoteResponse': {'result': [{'symbol': 'AAPL', 'marketCap': 1000}]}}
+        mock_session_get.side_effect = [_mock_rejected, _mock_cookie, _mock_crumb, _mock_response]
+        _test_output = QuoteBatch.fetch(['AAPL'])
+        self.assertEqual(_test_output['AAPL']['marketCap'], 1000)
+        self.assertEqual(mock_session_get.call_count, 4)
+        self.assertEqual(mock_session_get.call_args_list[0][1]['params']['crumb'], 'expired')
+        self.assertEqual(mock_session_get.call_args[1]['params']['crumb'], 'renewed')
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'renewed'})
+    def test_clear_credentials(self):
+        """
+        TestCase for _clear_credentials() keeping a crumb renewed by another caller.
+        """
+        _clear_credentials('expired')
+        self.assertEqual(_CREDENTIALS, {'crumb': 'renewed'})
+        _clear_credentials('renewed')
+        self.assertEqual(_CREDENTIALS, {})
+
+    def test_get_field_async_stock(self):
+        """
+        TestCase for AsyncStock.get_field().
+        """
+        class _MockResponse(object):
+            status = 200
+
+            def raise_for_status(self):
+                pass
+
+            async def json(self):
+                return {'quoteResponse': {'result': [{'symbol': 'AAPL', 'regularMarketPreviousClose': 100.0}]}}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+        _mock_session = MagicMock()
+        _mock_session.get.return_value = _MockResponse()
+
+        async def _run():
+            _test_stock_instance = AsyncStock('AAPL', _mock_session, asyncio.Semaphore(1), 'test')
+            return await _test_stock_instance.get_previous_close(), await _test_stock_instance.get_field('marketCap')
+
+        self.assertEqual(asyncio.run(_run()), (100.0, 0))
+        self.assertEqual(_mock_session.get.call_count, 1)
+
+    @patch.dict('src.financial_API_utility._CREDENTIALS', {'crumb': 'expired'})
+    @patch('src.financial_API_utility._SHARED_SESSION.get')
+    def test_get_field_async_stock_crumb_rejected(self, mock_session_get):
+        """
+        TestCase for AsyncStock.get_field() with a crumb rejected by Yahoo Finance.
+        """
+        class _MockResponse(object):
+            def __init__(self, v_status):
+                self.status = v_status
+
+            def raise_for_status(self):
+                if self.status >= 400:
+                    raise RuntimeError(f'HTTP {self.status}')
+
+            async def json(self):
+                return {'quoteResponse': {'result': [{'symbol': 'AAPL', 'regularMarketPreviousClose': 100.0}]}}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+        mock_session_get.side_effect = [MagicMock(status_code=200), MagicMock(status_code=200, text='renewed')]
+        _mock_session = MagicMock()
+        _mock_session.get.side_effect = [_MockResponse(401), _MockResponse(200)]
+
+        async def _run():
+            _test_stock_instance = AsyncStock('AAPL', _mock_session, asyncio.Semaphore(1), 'expired')
+            return await _test_stock_instance.get_previous_close()
+
+        self.assertEqual(asyncio.run(_run()), 100.0)
+        self.assertEqual(_mock_session.get.call_count, 2)
+        self.assertEqual(_mock_session.get.call_args_list[0][1]['params']['crumb'], 'expired')
+        self.assertEqual(_mock_session.get.call_args[1]['params']['crumb'], 'renewed')
+        self.assertEqual(mock_session_get.call_count, 2)
+        self.assertTrue(_mock_session.cookie_jar.update_cookies.called)
+
+    @patch('src.financial_API_utility.aiohttp')
+    @patch('src.financial_API_utility._get_credentials')
+    def test_fetch_portfolio(self, mock_get_credentials, mock_aiohttp):
+        """
+        TestCase for fetch_portfolio().
+        """
+        class _MockResponse(object):
+            status = 200
+
+            def __init__(self, v_symbol):
+                self.symbol = v_symbol
+
+            def raise_for_status(self):
+                pass
+
+            async def json(self):
+                return {'quoteResponse': {'result': [{'symbol': self.symbol, 'regularMarketPreviousClose': 100.0}]}}
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+        _test_threads = []
+
+        def _get_credentials():
+            _test_threads.append(threading.get_ident())
+            return 'test'
+
+        mock_get_credentials.side_effect = _get_credentials
+        _mock_session = MagicMock()
+        _mock_session.get.side_effect = lambda v_url, params: _MockResponse(params['symbols'])
+        mock_aiohttp.ClientSession.return_value.__aenter__.return_value = _mock_session
+        _test_output = asyncio.run(fetch_portfolio(['AAPL', 'MSFT']))
+        self.assertEqual(_test_output, {'AAPL': 100.0, 'MSFT': 100.0})
+        self.assertEqual(_mock_session.get.call_args[1]['params']['crumb'], 'test')
+        self.assertEqual(len(_test_threads), 1)
+        self.assertNotEqual(_test_threads[0], threading.get_ident())
+
+    @patch.dict('src.financial_API_utility._DISK_CACHE', clear=True)
+    @patch.dict('os.environ', {'PORTFOLIO_MGMT_DISK_CACHE': 'test/yf_info'})
+    @patch('src.financial_API_utility.diskcache')
+    def test_get_disk_cache_threads(self, mock_diskcache):
+        """
+        TestCase for _get_disk_cache() called from several threads at once.
+        """
+        def _open_cache(v_directory):
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_diskcache.Cache.side_effect = _open_cache
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            _test_output = list(executor.map(lambda x: _get_disk_cache(), range(8)))
+        self.assertEqual(mock_diskcache.Cache.call_count, 1)
+        self.assertEqual(mock_diskcache.Cache.call_args[0][0], 'test/yf_info')
+        self.assertTrue(all(x is _test_output[0] for x in _test_output))
+
+    @patch.dict('src.financial_API_utility._DISK_CACHE', clear=True)
+    @patch.dict('os.environ', clear=True)
+    @patch('src.financial_API_utility.diskcache')
+    def test_get_disk_cache_disabled(self, mock_diskcache):
+        """
+        TestCase for _get_disk_cache() without PORTFOLIO_MGMT_DISK_CACHE set.
+        """
+        self.assertIsNone(_get_disk_cache())
+        self.assertFalse(mock_diskcache.Cache.called)
+
+    def test_ttl_cache_lru(self):
+        """
+        TestCase for _TTLCache eviction of the least recently used entry.
+        """
+        _test_cache = _TTLCache(2, 300)
+        _test_cache.set('AAPL', 1)
+        _test_cache.set('MSFT', 2)
+        self.assertEqual(_test_cache.get('AAPL'), 1)
+        _test_cache.set('AMZN', 3)
+        self.assertEqual(_test_cache.get('AAPL'), 1)
+        self.assertIsNone(_test_cache.get('MSFT'))
+        self.assertEqual(_test_cache.get('AMZN'), 3)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_info_disk_cache(self, mock_ticker):
+        """
+        TestCase for Stock._get_info() with disk cache.
+        """
+        _mock_cache = MagicMock()
+        _mock_cache.get.return_value = {'marketCap': 1000}
+        self.mock_get_disk_cache.return_value = _mock_cache
+        _mock_info = PropertyMock(return_value={'marketCap': 2000})
+        type(mock_ticker.return_value).info = _mock_info
+        self.assertEqual(Stock('AAPL').get_market_cap(), 1000)
+        self.assertEqual(_mock_info.call_count, 0)
+        _mock_cache.get.return_value = None
+        self.assertEqual(Stock('MSFT').get_market_cap(), 2000)
+        self.assertEqual(_mock_info.call_count, 1)
+        self.assertTrue(_mock_cache.set.called)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_info_shared(self, mock_ticker):
+        """
+        TestCase for Stock._get_info() shared between instances.
+        """
+        _mock_info = PropertyMock(return_value={'marketCap': 1000})
+        type(mock_ticker.return_value).info = _mock_info
+        self.assertEqual(Stock('AAPL').get_market_cap(), 1000)
+        self.assertEqual(Stock('AAPL').get_market_cap(), 1000)
+        self.assertEqual(_mock_info.call_count, 1)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_previous_close_key(self, mock_ticker):
+        """
+        TestCase for Stock.get_previous_close() key selection.
+        """
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'previousClose': 100.0,
+                                                                         'regularMarketPreviousClose': 200.0})
+        self.assertEqual(Stock('AAPL').get_previous_close(), 100.0)
+        self.assertEqual(ETF('VOO').get_previous_close(), 200.0)
+        self.assertEqual(ETF('BSV').get_previous_close(), 200.0)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_previous_close_missing(self, mock_ticker):
+        """
+        TestCase for Stock.get_previous_close() when the price key is missing.
+        """
+        type(mock_ticker.return_value).info = PropertyMock(return_value={'marketCap': 1000})
+        with self.assertRaises(KeyError):
+            Stock('AAPL').get_previous_close()
+        with self.assertRaises(KeyError):
+            ETF('VOO').get_previous_close()
+        self.assertEqual(Stock('AAPL').get_market_cap(), 1000)
+
+    def test_generated_getters(self):
+        """
+        TestCase for getters generated on :class: Stock and :class: ETF.
+        """
+        self.assertEqual(Stock.get_low_52wks.__name__, 'get_low_52wks')
+        self.assertEqual(Stock.get_low_52wks.__qualname__, 'Stock.get_low_52wks')
+        self.assertEqual(ETF.get_yield.__qualname__, 'ETF.get_yield')
+        self.assertEqual(Stock.get_low_52wks.__code__.co_argcount, 1)
+        self.assertEqual(Stock.get_low_52wks.__doc__.strip(),
+                         'The :function: get_low_52wks is used to get 52weeks lowest trading price for a stock.')
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_slots(self, mock_ticker):
+        """
+        TestCase for Stock.__slots__ and ETF.__slots__.
+        """
+        self.assertFalse(hasattr(Stock('AAPL'), '__dict__'))
+        self.assertFalse(hasattr(ETF('VOO'), '__dict__'))
+
+    @patch.object(QuoteBatch, 'fetch')
+    def test_to_frame(self, mock_fetch):
+        """
+        TestCase for to_frame().
+        """
+        mock_fetch.return_value = {'MSFT': {'symbol': 'MSFT', 'marketCap': 2000, 'regularMarketPreviousClose': 200.0},
+                                   'AAPL': {'symbol': 'AAPL', 'marketCap': 1000}}
+        _test_output = to_frame(['AAPL', 'MSFT'])
+        self.assertEqual(list(_test_output.index), ['AAPL', 'MSFT'])
+        self.assertTrue('PREV_CLOSE' in _test_output.columns)
+        self.assertEqual(list(_test_output['MKT_CAP']), [1000, 2000])
+        _test_output = to_frame(['AAPL', 'MSFT'], ['PREV_CLOSE'])
+        self.assertEqual(list(_test_output.columns), ['PREV_CLOSE'])
+        self.assertEqual(_test_output.loc['MSFT', 'PREV_CLOSE'], 200.0)
+        _test_output = to_frame(['aapl', 'msft'])
+        mock_fetch.assert_called_with(['AAPL', 'MSFT'])
+        self.assertEqual(list(_test_output.index), ['AAPL', 'MSFT'])
+        self.assertEqual(list(_test_output['MKT_CAP']), [1000, 2000])
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_init_stock_prefetch(self, mock_ticker):
+        """
+        TestCase for Stock.__init__() with v_prefetch.
+        """
+        _mock_info = PropertyMock(return_value={'marketCap': 1000})
+        type(mock_ticker.return_value).info = _mock_info
+        Stock('AAPL')
+        self.assertEqual(_mock_info.call_count, 0)
+        Stock('MSFT', v_prefetch=True)
+        self.assertEqual(_mock_info.call_count, 1)
+
+    @patch('src.financial_API_utility.yf.Ticker')
+    def test_get_info_bad_ticker(self, mock_ticker):
+        """
+        TestCase for Stock._get_info() with a bad ticker.
+        """
+        _mock_info = PropertyMock(return_value={})
+        type(mock_ticker.return_value).info = _mock_info
+        self.assertEqual(Stock('XXXXX').get_market_cap(), 0)
+        self.assertEqual(Stock('XXXXX').get_name(), '')
+        self.assertEqual(_mock_info.call_count, 1)
@@ -95,6 +95,26 @@ class TestFixedSQLiteRequests(unittest.TestCase):
         except Exception as e:
             self.fail(":function: create_view_positions_fixed() raised exception unexpectedly ! -> "+str(e))
 
+    def test_upgrade_table_transactions_fixed(self):
+        """
+        TestCase for FixedSQLiteRequest.upgrade_table_transactions_fixed().
+        """
+        _test_instance = FixedSQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions_fixed()
+        this_conn = _test_instance._create_connection()
+        this_conn.execute("DROP INDEX idx_transactions_end_date;")
+        this_conn.close()
+        try:
+            self.assertTrue(_test_instance.upgrade_table_transactions_fixed())
+            this_conn = _test_instance._create_connection()
+            test_output = this_conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                                            "AND name = 'idx_transactions_end_date';").fetchall()
+            this_conn.close()
+            self.assertEqual(len(test_output), 1)
+        except Exception as e:
+            self.fail(":function: upgrade_table_transactions_fixed() raised exception unexpectedly ! -> " + str(e))
+
     def test_insert_into_table_transactions_fixed(self):
         """
         TestCase for FixedSQLiteRequest.insert_into_table_transactions_fixed().
@@ -222,6 +242,25 @@ class TestFixedSQLiteRequests(unittest.TestCase):
         except Exception as e:
             self.fail(":function: get_table_transaction_fixed() raised exception unexpectedly ! -> " + str(e))
 
+    def test_get_table_transactions_fixed_active_only(self):
+        """
+        TestCase for FixedSQLiteRequest.get_table_transactions_fixed(v_active_only=True).
+        """
+        _test_instance = FixedSQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions_fixed()
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX1', 'TREA', 150, 100.0,
+                                                            '2018-12-31', '2019-12-31', 14000.0, 'TD', YTM=0.025)
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX2', 'TREA', 100, 100.0,
+                                                            '2019-06-30', '2020-06-30', 9500.0, 'TD', YTM=0.025)
+        try:
+            test_output = _test_instance.get_table_transactions_fixed(v_active_only=True, v_as_of='2020-01-01')
+            self.assertEqual(len(test_output), 1)
+            self.assertEqual(test_output[0]['SYMBOL'], 'XXXXXXXX2')
+            self.assertEqual(len(_test_instance.get_table_transactions_fixed(v_active_only=True)), 0)
+        except Exception as e:
+            self.fail(":function: get_table_transaction_fixed() raised exception unexpectedly ! -> " + str(e))
+
     def test_get_view_positions_fixed(self):
         """
         TestCase for FixedSQLiteRequest.get_view_positions_fixed().
@@ -249,3 +288,25 @@ class TestFixedSQLiteRequests(unittest.TestCase):
             self.assertEqual(int(test_output[0]['IS_MATURED']), 0)
         except Exception as e:
             self.fail(":function: get_view_positions_fixed() raised exception unexpectedly ! -> " + str(e))
+
+    def test_get_allocation_by_type_fixed(self):
+        """
+        TestCase for FixedSQLiteRequest.get_allocation_by_type_fixed().
+        """
+        _test_instance = FixedSQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions_fixed()
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX1', 'TREA', 150, 100.0,
+                                                            '2018-12-31', '2099-12-31', 14000.0, 'TD', YTM=0.025)
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX2', 'TREA', 50, 100.0,
+                                                            '2018-12-31', '2099-06-30', 4900.0, 'TD', YTM=0.02)
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX3', 'TREA', 10, 100.0,
+                                                            '2018-12-31', '2019-12-31', 990.0, 'TD', YTM=0.02)
+        _test_instance.create_view_positions_fixed()
+        try:
+            test_output = _test_instance.get_allocation_by_type_fixed()
+            self.assertEqual(len(test_output), 1)
+            self.assertEqual(test_output[0]['INVESTMENT_TYPE'], 'TREA')
+            self.assertEqual(float(test_output[0]['TOTAL_DOLLARS']), 20000.0)
+        except Exception as e:
+            self.fail(":function: get_allocation_by_type_fixed() raised exception unexpectedly ! -> " + str(e))
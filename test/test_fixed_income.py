@@ -57,6 +57,15 @@ class TestFixedIncomeCommands(unittest.TestCase):
         self.assertTrue(mock_crt_position.called)
         self.assertTrue(mock_load_backup.called)
 
+    @patch.object(FixedSQLiteRequest, "upgrade_table_transactions_fixed")
+    def test_upgrade(self, mock_upgrade):
+        """
+        TestCase for DbCommands.upgrade().
+        """
+        _test_instance = DbCommands()
+        _test_instance.upgrade()
+        self.assertTrue(mock_upgrade.called)
+
     @patch.object(FixedSQLiteRequest, "insert_into_table_transactions_fixed")
     def test_add(self, mock_class_insert):
         """
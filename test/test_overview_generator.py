@@ -40,12 +40,13 @@ class TestSummaryTool(unittest.TestCase):
         TestCase for SummaryTool._get_eq_transactions_data().
         """
         _test_instance = SummaryTool()
-        mock_get_eq_transactions.return_value = [{'ID': None, 'SYMBOL': 'AAPL', 'TYPE': None, 'DATE': None,
-                                                  'DOLLARS': 120.0, 'UNITS': None, 'INVESTMENT_TYPE': None,
-                                                  'DESCRIPTION': None, 'ACCOUNT': None, 'TOTAL_DOLLARS': None}
-                                                 ]
+        _test_rows = [{'ID': None, 'SYMBOL': 'AAPL', 'TYPE': None, 'DATE': None,
+                       'DOLLARS': 120.0, 'UNITS': None, 'INVESTMENT_TYPE': None,
+                       'DESCRIPTION': None, 'ACCOUNT': None, 'TOTAL_DOLLARS': None}
+                      ]
+        mock_get_eq_transactions.return_value = pd.DataFrame(_test_rows)
         _test_output = _test_instance._get_eq_transactions_data()
-        self.assertTrue(mock_get_eq_transactions.called)
+        mock_get_eq_transactions.assert_called_with(v_as_frame=True)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'AAPL')
@@ -57,13 +58,14 @@ class TestSummaryTool(unittest.TestCase):
         TestCase for SummaryTool._get_eq_positions_data().
         """
         _test_instance = SummaryTool()
-        mock_get_eq_positions.return_value = [{'SYMBOL': 'VOO', 'DESCRIPTION': None, 'INVESTMENT_TYPE': None,
-                                               'COST_DOLLARS': None, 'DOLLARS': 400.0, 'UNITS': None,
-                                               'LAST_UPDATED': None, 'MKT_VALUE': None,
-                                               'GAIN_PER_SHARE': None, 'GAIN_TOTAL': None, 'GAIN_PERCENTAGE': None}
-                                              ]
+        _test_rows = [{'SYMBOL': 'VOO', 'DESCRIPTION': None, 'INVESTMENT_TYPE': None,
+                       'COST_DOLLARS': None, 'DOLLARS': 400.0, 'UNITS': None,
+                       'LAST_UPDATED': None, 'MKT_VALUE': None,
+                       'GAIN_PER_SHARE': None, 'GAIN_TOTAL': None, 'GAIN_PERCENTAGE': None}
+                      ]
+        mock_get_eq_positions.return_value = pd.DataFrame(_test_rows)
         _test_output = _test_instance._get_eq_positions_data()
-        self.assertTrue(mock_get_eq_positions.called)
+        mock_get_eq_positions.assert_called_with(v_as_frame=True)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'VOO')
@@ -75,13 +77,14 @@ class TestSummaryTool(unittest.TestCase):
         TestCase for SummaryTool._get_fixed_positions_data().
         """
         _test_instance = SummaryTool()
-        mock_get_fix_positions.return_value = [{'NAME': None, 'SYMBOL': 'BLV', 'INVESTMENT_TYPE': None,
-                                                'UNITS': None, 'FACE_VALUE': 5000.0, 'TOTAL_DOLLARS': None,
-                                                'ADD_DATE': None, 'END_DATE': None, 'TOTAL_COST': None,
-                                                'RETURN_RATE': None, 'RETURN_DOLLARS': None, 'IS_MATURED': None}
-                                               ]
+        _test_rows = [{'NAME': None, 'SYMBOL': 'BLV', 'INVESTMENT_TYPE': None,
+                       'UNITS': None, 'FACE_VALUE': 5000.0, 'TOTAL_DOLLARS': None,
+                       'ADD_DATE': None, 'END_DATE': None, 'TOTAL_COST': None,
+                       'RETURN_RATE': None, 'RETURN_DOLLARS': None, 'IS_MATURED': None}
+                      ]
+        mock_get_fix_positions.return_value = pd.DataFrame(_test_rows)
         _test_output = _test_instance._get_fixed_positions_data()
-        self.assertTrue(mock_get_fix_positions.called)
+        mock_get_fix_positions.assert_called_with(v_as_frame=True)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'BLV')
@@ -93,13 +96,14 @@ class TestSummaryTool(unittest.TestCase):
         TestCase for SummaryTool._get_fixed_transactions_data().
         """
         _test_instance = SummaryTool()
-        mock_get_fixed_transactions.return_value = [{'ID': None, 'NAME': None, 'SYMBOL': 'VTIP',
-                                                     'INVESTMENT_TYPE': None, 'UNITS': None, 'FACE_VALUE': 1000.0,
-                                                     'TOTAL_DOLLARS': None, 'ADD_DATE': None, 'END_DATE': None,
-                                                     'TOTAL_COST': None, 'APR': None, 'YTM': None, 'ACCOUNT': None}
-                                                    ]
+        _test_rows = [{'ID': None, 'NAME': None, 'SYMBOL': 'VTIP',
+                       'INVESTMENT_TYPE': None, 'UNITS': None, 'FACE_VALUE': 1000.0,
+                       'TOTAL_DOLLARS': None, 'ADD_DATE': None, 'END_DATE': None,
+                       'TOTAL_COST': None, 'APR': None, 'YTM': None, 'ACCOUNT': None}
+                      ]
+        mock_get_fixed_transactions.return_value = pd.DataFrame(_test_rows)
         _test_output = _test_instance._get_fixed_transactions_data()
-        self.assertTrue(mock_get_fixed_transactions.called)
+        mock_get_fixed_transactions.assert_called_with(v_as_frame=True, v_active_only=True)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'VTIP')
@@ -111,18 +115,66 @@ class TestSummaryTool(unittest.TestCase):
         TestCase for SummaryTool._get_other_investment_information().
         """
         _test_instance = SummaryTool()
-        mock_pd_read_json.return_value = [{'DESCRIPTION': 'CD', 'MAJOR_TYPE': None, 'MINOR_TYPE': None,
-                                           'DOLLARS': 500.0, 'ACCOUNT': None}
-                                          ]
+        _test_rows = [{'DESCRIPTION': 'CD', 'MAJOR_TYPE': None, 'MINOR_TYPE': None, 'DOLLARS': 500.0, 'ACCOUNT': None}]
+        mock_pd_read_json.return_value = pd.DataFrame(_test_rows)
         _test_output = _test_instance._get_other_investment_information()
-        self.assertTrue(mock_pd_read_json.called)
+        mock_pd_read_json.assert_called_with(_test_instance.other_investment_file, orient='records', typ='frame',
+                                             dtype={'DOLLARS': 'float64'})
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['DESCRIPTION'], 'CD')
         self.assertEqual(_test_output.iloc[0]['DOLLARS'], 500.0)
+        self.assertEqual(list(_test_output.columns),
+                         ['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS', 'ACCOUNT'])
+        self.assertEqual(_test_output['ACCOUNT'].dtype, 'category')
 
-    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch('src.overview_generator.os.path.getmtime')
+    @patch('src.overview_generator.os.path.exists')
+    @patch.object(eq_SQLiteRequest, "get_view_positions")
+    def test_get_eq_positions_data_cached(self, mock_get_eq_positions, mock_exists, mock_getmtime):
+        """
+        TestCase for SummaryTool._get_eq_positions_data() served from the instance cache.
+        """
+        _test_instance = SummaryTool()
+        mock_exists.return_value = True
+        mock_getmtime.side_effect = [100.0, 100.0, 200.0]
+        _test_rows = [{'SYMBOL': 'VOO', 'DESCRIPTION': None, 'INVESTMENT_TYPE': None,
+                       'COST_DOLLARS': None, 'DOLLARS': 400.0, 'UNITS': None,
+                       'LAST_UPDATED': None, 'MKT_VALUE': None,
+                       'GAIN_PER_SHARE': None, 'GAIN_TOTAL': None, 'GAIN_PERCENTAGE': None}
+                      ]
+        mock_get_eq_positions.return_value = pd.DataFrame(_test_rows)
+        _test_output = _test_instance._get_eq_positions_data()
+        self.assertIs(_test_instance._get_eq_positions_data(), _test_output)
+        self.assertEqual(mock_get_eq_positions.call_count, 1)
+        _test_instance._get_eq_positions_data()
+        self.assertEqual(mock_get_eq_positions.call_count, 2)
+
+    @patch.object(SummaryTool, "_get_fixed_allocation_by_type_data")
+    @patch.object(SummaryTool, "_get_eq_account_dollars_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
     @patch.object(SummaryTool, "_get_fixed_positions_data")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    def test_cache_result(self, mock_get_eq_transactions, mock_get_eq_positions, mock_get_fixed_positions,
+                          mock_get_fixed_transactions, mock_get_other_investments, mock_get_eq_account_dollars,
+                          mock_get_fixed_allocation_by_type):
+        """
+        TestCase for SummaryTool.cache_result().
+        """
+        _test_instance = SummaryTool()
+        self.assertIs(_test_instance.cache_result(), _test_instance)
+        self.assertTrue(mock_get_eq_transactions.called)
+        self.assertTrue(mock_get_eq_positions.called)
+        self.assertTrue(mock_get_fixed_positions.called)
+        self.assertTrue(mock_get_fixed_transactions.called)
+        self.assertTrue(mock_get_other_investments.called)
+        self.assertTrue(mock_get_eq_account_dollars.called)
+        self.assertTrue(mock_get_fixed_allocation_by_type.called)
+
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_fixed_allocation_by_type_data")
     @patch.object(SummaryTool, "_get_other_investment_information")
     def test_generate_allocation_report_type(self, mock_get_other_investments, mock_get_fixed_positions,
                                              mock_get_eq_positions):
@@ -132,15 +184,15 @@ class TestSummaryTool(unittest.TestCase):
         _test_instance = SummaryTool()
         _dict_eq_positions = {
             'SYMBOL': ['VOO', 'BLV', 'AAPL'],
-            'INVESTMENT_TYPE': ['etf', 'etf', 'stock'],
+            'INVESTMENT_TYPE': ['ETF', 'ETF', 'STOCK'],
             'MKT_VALUE': [10000.0, 5000.0, 2000.0]
         }
         _dict_fixed_positions = {
-            'SYMBOL': ['TEST01', 'TEST02'],
-            'INVESTMENT_TYPE': ['CD', 'CD'],
-            'TOTAL_DOLLARS': [3000.0, 2000.0]
+            'INVESTMENT_TYPE': ['CD'],
+            'TOTAL_DOLLARS': [5000.0]
         }
         _dict_other_investments = {
+            'SUFFIX': ['n/a'],
             'DESCRIPTION': ['TEST03'],
             'MAJOR_TYPE': ['Cash Equivalent'],
             'MINOR_TYPE': ['Saving'],
@@ -153,7 +205,7 @@ class TestSummaryTool(unittest.TestCase):
         mock_get_eq_positions.return_value = _pd_eq_positions
         mock_get_fixed_positions.return_value = _pd_fixed_positions
         mock_get_other_investments.return_value = _pd_other_investments
-        _test_output = _test_instance.generate_allocation_report_type()
+        _test_output = _test_instance.format_for_display(_test_instance.generate_allocation_report_type())
         self.assertTrue(mock_get_eq_positions.called)
         self.assertTrue(mock_get_fixed_positions.called)
         self.assertTrue(mock_get_other_investments.called)
@@ -166,6 +218,43 @@ class TestSummaryTool(unittest.TestCase):
         self.assertEqual(list(_test_output['MINOR_TOTAL_DOLLARS']),
                          ['$10,000', '$2,000', '$10,000', '$5,000', '$5,000', '$nan'])
 
+    def test_format_for_display(self):
+        """
+        TestCase for SummaryTool.format_for_display().
+        """
+        _dict_report = {
+            'MAJOR_TYPE': ['EQUITY', 'EQUITY', 'TOTAL'],
+            'MAJOR_TOTAL_DOLLARS': [3000.0, 3000.0, 3000.0],
+            'MAJOR_ALLOCATION': [100.0, 100.0, 100.0],
+            'MINOR_TYPE': ['Large-Cap', 'Small-Cap', ''],
+            'MINOR_TOTAL_DOLLARS': [2000.0, 1000.0, float('nan')],
+            'MINOR_ALLOCATION': [200 / 3, 100 / 3, float('nan')]
+        }
+        _pd_report = pd.DataFrame(data=_dict_report)
+        _test_output = SummaryTool.format_for_display(_pd_report)
+        self.assertEqual(_pd_report['MAJOR_TOTAL_DOLLARS'].dtype, 'float64')
+        self.assertEqual(list(_test_output['MAJOR_TOTAL_DOLLARS']), ['$3,000', '', '$3,000'])
+        self.assertEqual(list(_test_output['MAJOR_ALLOCATION']), ['100%', '', '100%'])
+        self.assertEqual(list(_test_output['MINOR_ALLOCATION']), ['66.67%', '33.33%', 'nan%'])
+
+    def test_two_level_allocation_report_tied_outer(self):
+        """
+        TestCase for SummaryTool._two_level_allocation_report() with two outer groups of the same total.
+        """
+        _test_instance = SummaryTool()
+        _dict_tagged = {
+            'MAJOR_TYPE': ['A', 'A', 'B', 'B'],
+            'MINOR_TYPE': ['x', 'w', 'y', 'z'],
+            'DOLLARS': [3000.0, 1000.0, 2000.0, 2000.0]
+        }
+        _pd_tagged = pd.DataFrame(data=_dict_tagged)
+        _test_output = _test_instance.format_for_display(_test_instance._two_level_allocation_report(
+            _pd_tagged, 'MAJOR_TYPE', 'MINOR_TYPE', 'MAJOR', 'MINOR'))
+        self.assertEqual(list(_test_output['MAJOR_TYPE']), ['A', 'A', 'B', 'B', 'TOTAL'])
+        self.assertEqual(list(_test_output['MINOR_TYPE']), ['x', 'w', 'y', 'z', ''])
+        self.assertEqual(list(_test_output['MAJOR_TOTAL_DOLLARS']), ['$4,000', '', '$4,000', '', '$8,000'])
+        self.assertEqual(list(_test_output['MAJOR_ALLOCATION']), ['50%', '', '50%', '', '100%'])
+
     @patch.object(SummaryTool, "_get_fixed_positions_data")
     def test_generate_mature_calender(self, mock_get_fixed_positions):
         """
@@ -180,54 +269,45 @@ class TestSummaryTool(unittest.TestCase):
         }
         _pd_fixed_positions = pd.DataFrame(data=_dict_fixed_positions)
         mock_get_fixed_positions.return_value = _pd_fixed_positions
-        _test_output = _test_instance.generate_mature_calender()
+        _test_report = _test_instance.generate_mature_calender()
         self.assertTrue(mock_get_fixed_positions.called)
+        self.assertEqual(list(_test_report.iloc[1]), ['2099-02', 4000.0, 2, 3.0, 'TEST02, TEST04'])
+        _test_output = _test_instance.format_for_display(_test_report)
         self.assertEqual(_test_output.shape[0], 3)
         self.assertEqual(list(_test_output.columns),
-                         ['index', 'MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF'])
+                         ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF'])
         self.assertEqual(list(_test_output['MATURE_DATE']), ['2099-01', '2099-02', '2099-03'])
-        self.assertEqual(list(_test_output.iloc[0]), [0, '2099-01', '$1,000', 1, '1.00%', 'TEST01'])
+        self.assertEqual(list(_test_output.iloc[0]), ['2099-01', '$1,000', 1, '1.00%', 'TEST01'])
 
-    @patch.object(SummaryTool, "_get_eq_positions_data")
-    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_account_dollars_data")
     @patch.object(SummaryTool, "_get_fixed_transactions_data")
     @patch.object(SummaryTool, "_get_other_investment_information")
     def test_generate_allocation_report_account(self, mock_get_other_investment, mock_get_fixed_transactions,
-                                                mock_get_eq_transactions, mock_get_eq_positions):
+                                                mock_get_eq_account_dollars):
         """
         TestCase for SummaryTool.generate_allocation_report_account().
         """
         _test_instance = SummaryTool()
-        _dict_eq_positions = {
-            'SYMBOL': ['VOO', 'BLV'],
-            'DOLLARS': [400.0, 100.0]
-        }
-        _dict_eq_transactions = {
-            'SYMBOL': ['VOO', 'VOO', 'BLV', 'BLV'],
-            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL'],
-            'UNITS': [20, 5, 100, 50],
-            'ACCOUNT': ['TD', 'Fidelity', 'TD', 'TD']
+        _dict_eq_account_dollars = {
+            'ACCOUNT': ['Fidelity', 'TD'],
+            'TOTAL_DOLLARS': [2000.0, 13000.0]
         }
         _dict_fixed_transactions = {
-            'TOTAL_DOLLARS': [5000.0, 2000.0],
-            'END_DATE': ['2099-02-15', '2001-01-15'],
-            'ACCOUNT': ['TD', 'TD']
+            'TOTAL_DOLLARS': [5000.0],
+            'ACCOUNT': ['TD']
         }
         _dict_other_investments = {
             'ACCOUNT': ['CITI', 'Fidelity'],
             'DOLLARS': [5000.0, 5000.0]
         }
-        _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
-        _pd_eq_transactions = pd.DataFrame(data=_dict_eq_transactions)
+        _pd_eq_account_dollars = pd.DataFrame(data=_dict_eq_account_dollars)
         _pd_fixed_transactions = pd.DataFrame(data=_dict_fixed_transactions)
         _pd_other_investments = pd.DataFrame(data=_dict_other_investments)
-        mock_get_eq_positions.return_value = _pd_eq_positions
-        mock_get_eq_transactions.return_value = _pd_eq_transactions
+        mock_get_eq_account_dollars.return_value = _pd_eq_account_dollars
         mock_get_fixed_transactions.return_value = _pd_fixed_transactions
         mock_get_other_investment.return_value = _pd_other_investments
-        _test_output = _test_instance.generate_allocation_report_account()
-        self.assertTrue(mock_get_eq_positions.called)
-        self.assertTrue(mock_get_eq_transactions.called)
+        _test_output = _test_instance.format_for_display(_test_instance.generate_allocation_report_account())
+        self.assertTrue(mock_get_eq_account_dollars.called)
         self.assertTrue(mock_get_fixed_transactions.called)
         self.assertTrue(mock_get_other_investment.called)
         self.assertEqual(_test_output.shape[0], 3)
@@ -249,7 +329,7 @@ class TestSummaryTool(unittest.TestCase):
         }
         _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
         mock_get_eq_positions.return_value = _pd_eq_positions
-        _test_output = _test_instance.generate_allocation_report_equity_etf()
+        _test_output = _test_instance.format_for_display(_test_instance.generate_allocation_report_equity_etf())
         self.assertTrue(mock_get_eq_positions.called)
         self.assertEqual(_test_output.shape[0], 4)
         self.assertEqual(list(_test_output.columns), ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS',
@@ -271,7 +351,7 @@ class TestSummaryTool(unittest.TestCase):
         }
         _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
         mock_get_eq_positions.return_value = _pd_eq_positions
-        _test_output = _test_instance.generate_allocation_report_fixed_etf()
+        _test_output = _test_instance.format_for_display(_test_instance.generate_allocation_report_fixed_etf())
         self.assertTrue(mock_get_eq_positions.called)
         self.assertEqual(_test_output.shape[0], 3)
         self.assertEqual(list(_test_output.columns), ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS',
@@ -291,38 +371,35 @@ class TestSummaryTool(unittest.TestCase):
         _dict_eq_positions = {
             'SYMBOL': ['VOO', 'VO', 'VB', 'BLV', 'VTIP', 'AAPL', 'MSFT'],
             'DESCRIPTION': [None, None, None, None, None, None, None],
-            'INVESTMENT_TYPE': ['etf', 'etf', 'etf', 'etf', 'etf', 'stock', 'stock'],
+            'INVESTMENT_TYPE': ['ETF', 'ETF', 'ETF', 'ETF', 'ETF', 'STOCK', 'STOCK'],
             'MKT_VALUE': [20000.0, 2000.0, 2000.0, 10000.0, 5000.0, 2000.0, 3000.0]
         }
         _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
         mock_get_eq_positions.return_value = _pd_eq_positions
-        _test_output = _test_instance.generate_allocation_report_equity_stock()
+        _test_output = _test_instance.format_for_display(_test_instance.generate_allocation_report_equity_stock())
         self.assertTrue(mock_get_eq_positions.called)
         self.assertEqual(_test_output.shape[0], 3)
         self.assertEqual(list(_test_output.columns), ['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION'])
         self.assertEqual(list(_test_output['DOLLARS']), ['$3,000', '$2,000', '$5,000'])
         self.assertEqual(list(_test_output.iloc[0]), ['MSFT', None, '$3,000', '60.00%'])
 
-    @patch.object(SummaryTool, "_get_eq_transactions_data")
-    @patch.object(SummaryTool, "_get_eq_positions_data")
-    @patch.object(SummaryTool, "_get_other_investment_information")
-    def test_generate_allocation_report_etf_w_account(self, mock_get_other_investments, mock_get_eq_positions,
-                                                      mock_get_eq_transactions):
+    @staticmethod
+    def _mock_etf_w_account_data(mock_get_eq_transactions, mock_get_eq_positions, mock_get_other_investments,
+                                 mock_get_fixed_transactions):
         """
-        TestCase for SummaryTool.generate_allocation_report_etf_w_account().
+        Shared source data for the SummaryTool.generate_allocation_report_etf_w_account() TestCases.
         """
-        _test_instance = SummaryTool()
         _dict_eq_transactions = {
-            'SYMBOL': ['VOO', 'VOO', 'VB', 'VB', 'BLV', 'AAPL'],
-            'ACCOUNT': ['Fidelity', 'TD', 'Fidelity', 'Fidelity', 'TD', 'Fidelity'],
-            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL', 'BUY', 'BUY'],
-            'UNITS': [30, 20, 100, 50, 100, 10]
+            'SYMBOL': ['VOO', 'VOO', 'VB', 'VB', 'BLV', 'AAPL', 'XYZ', 'VB'],
+            'ACCOUNT': ['Fidelity', 'TD', 'Fidelity', 'Fidelity', 'TD', 'Fidelity', 'Schwab', 'Schwab'],
+            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL', 'BUY', 'BUY', 'BUY', 'BUY'],
+            'UNITS': [30, 20, 100, 50, 100, 10, 10, 10]
         }
         _dict_eq_positions = {
-            'SYMBOL': ['VOO', 'VB', 'BLV', 'AAPL'],
-            'DESCRIPTION': [None, None, None, None],
-            'INVESTMENT_TYPE': ['etf', 'etf', 'etf', 'stock'],
-            'DOLLARS': [400.0, 100.0, 100.0, 200.0]
+            'SYMBOL': ['VOO', 'VB', 'BLV', 'AAPL', 'XYZ'],
+            'DESCRIPTION': [None, None, None, None, None],
+            'INVESTMENT_TYPE': ['ETF', 'ETF', 'ETF', 'STOCK', 'ETF'],
+            'DOLLARS': [400.0, 100.0, 100.0, 200.0, 50.0]
         }
         _dict_other_investments = {
             'SUFFIX': ['n/a', 'n/a'],
@@ -331,17 +408,77 @@ class TestSummaryTool(unittest.TestCase):
             'ACCOUNT': ['Fidelity', 'Fidelity'],
             'DOLLARS': [3000.0, 3000.0]
         }
-        _pd_eq_transactions = pd.DataFrame(data=_dict_eq_transactions)
-        _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
-        _pd_other_investments = pd.DataFrame(data=_dict_other_investments)
-        mock_get_eq_transactions.return_value = _pd_eq_transactions
-        mock_get_eq_positions.return_value = _pd_eq_positions
-        mock_get_other_investments.return_value = _pd_other_investments
+        _dict_fixed_transactions = {
+            'TOTAL_DOLLARS': [2000.0, 1000.0],
+            'INVESTMENT_TYPE': ['CD', 'TREASURY'],
+            'ACCOUNT': ['Fidelity', 'Schwab']
+        }
+        mock_get_eq_transactions.return_value = pd.DataFrame(data=_dict_eq_transactions)
+        mock_get_eq_positions.return_value = pd.DataFrame(data=_dict_eq_positions)
+        mock_get_other_investments.return_value = pd.DataFrame(data=_dict_other_investments)
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data=_dict_fixed_transactions)
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    def test_generate_allocation_report_etf_w_account(self, mock_get_eq_transactions, mock_get_eq_positions,
+                                                      mock_get_other_investments, mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_allocation_report_etf_w_account().
+        """
+        _test_instance = SummaryTool()
+        self._mock_etf_w_account_data(mock_get_eq_transactions, mock_get_eq_positions, mock_get_other_investments,
+                                      mock_get_fixed_transactions)
         _test_output = _test_instance.generate_allocation_report_etf_w_account('Fidelity')
         self.assertTrue(mock_get_eq_positions.called)
-        self.assertEqual(_test_output.shape[0], 4)
+        self.assertTrue(mock_get_fixed_transactions.called)
         self.assertEqual(list(_test_output.columns), ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS',
                                                       'ASSET_CLASS_ALLOCATION', 'SUBCLASS',
                                                       'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'])
-        self.assertEqual(list(_test_output['SUBCLASS_TOTAL_DOLLARS']), ['$12,000', '$6,000', '$5,000', '$nan'])
-        self.assertEqual(list(_test_output.iloc[0]), ['Large-Cap', '$12,000', '52.17%', 'Blend', '$12,000', '52.17%'])
+        self.assertEqual(list(_test_output['ASSET_CLASS']),
+                         ['Large-Cap', 'Cash Equivalent', 'Small-Cap', 'Fixed Income', 'TOTAL'])
+        self.assertEqual(list(_test_output['SUBCLASS']), ['Blend', 'Cash', 'Blend', 'CD', ''])
+        self.assertEqual(_test_output['SUBCLASS_TOTAL_DOLLARS'].dtype, 'float64')
+        self.assertEqual(list(_test_output['SUBCLASS_TOTAL_DOLLARS'].iloc[:-1]), [12000.0, 6000.0, 5000.0, 2000.0])
+        self.assertEqual(list(_test_output['ASSET_CLASS_ALLOCATION']), [48.0, 24.0, 20.0, 8.0, 100.0])
+        self.assertEqual(_test_output.iloc[-1]['ASSET_CLASS_TOTAL_DOLLARS'], 25000.0)
+        _test_display = _test_instance.format_for_display(_test_output)
+        self.assertEqual(list(_test_display.iloc[0]), ['Large-Cap', '$12,000', '48.0%', 'Blend', '$12,000', '48.00%'])
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    def test_generate_allocation_report_etf_w_account_etf_only(self, mock_get_eq_transactions, mock_get_eq_positions,
+                                                               mock_get_other_investments,
+                                                               mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_allocation_report_etf_w_account() with no cash or fixed income rows.
+        """
+        _test_instance = SummaryTool()
+        self._mock_etf_w_account_data(mock_get_eq_transactions, mock_get_eq_positions, mock_get_other_investments,
+                                      mock_get_fixed_transactions)
+        _test_output = _test_instance.generate_allocation_report_etf_w_account('TD')
+        self.assertEqual(list(_test_output['ASSET_CLASS']), ['Fixed Income', 'Large-Cap', 'TOTAL'])
+        self.assertEqual(list(_test_output['SUBCLASS']), ['Long-Term Blend', 'Blend', ''])
+        self.assertEqual(list(_test_output['ASSET_CLASS_TOTAL_DOLLARS']), [10000.0, 8000.0, 18000.0])
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    def test_generate_allocation_report_etf_w_account_unknown_symbol(self, mock_get_eq_transactions,
+                                                                     mock_get_eq_positions,
+                                                                     mock_get_other_investments,
+                                                                     mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_allocation_report_etf_w_account() with a symbol missing from the fund list.
+        """
+        _test_instance = SummaryTool()
+        self._mock_etf_w_account_data(mock_get_eq_transactions, mock_get_eq_positions, mock_get_other_investments,
+                                      mock_get_fixed_transactions)
+        _test_output = _test_instance.generate_allocation_report_etf_w_account('Schwab')
+        self.assertEqual(list(_test_output['ASSET_CLASS']), ['Fixed Income', 'Small-Cap', 'Others', 'TOTAL'])
+        self.assertEqual(list(_test_output['SUBCLASS']), ['TREASURY', 'Blend', 'Others', ''])
+        self.assertEqual(list(_test_output['ASSET_CLASS_ALLOCATION']), [40.0, 40.0, 20.0, 100.0])